@@ -1,15 +1,21 @@
 from datetime import datetime
 from typing import Optional
 
+import fastapi
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from monty.json import MSONable
 from starlette.responses import RedirectResponse
 
 from maggma.api.resource import Resource
 
+# FastAPI 0.130 serializes responses straight to JSON bytes through pydantic, which is
+# faster than ORJSONResponse (now deprecated), so orjson is only the default before that
+_ORJSON_DEFAULT = tuple(int(v) for v in fastapi.__version__.split(".")[:2]) < (0, 130)
+
 
 class API(MSONable):
     """
@@ -68,6 +74,7 @@ class API(MSONable):
             debug=self.debug,
             description=self.description,
             openapi_tags=self.tags_meta,
+            **({"default_response_class": ORJSONResponse} if _ORJSON_DEFAULT else {}),
         )
 
         # Allow requests from other domains in debug mode. This allows
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Generic, Optional, TypeVar
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator
 
 from maggma import __version__
 
@@ -28,8 +28,7 @@ class Meta(BaseModel):
 
     total_doc: Optional[int] = Field(None, description="the total number of documents available for this query", ge=0)
 
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class Error(BaseModel):
@@ -51,24 +50,28 @@ class Response(BaseModel, Generic[DataT]):
     """
 
     data: Optional[list[DataT]] = Field(None, description="List of returned data")
-    errors: Optional[list[Error]] = Field(None, description="Any errors on processing this query")
-    meta: Optional[Meta] = Field(None, description="Extra information for the query")
+    errors: Optional[list[Error]] = Field(
+        None, description="Any errors on processing this query", validate_default=True
+    )
+    meta: Optional[Meta] = Field(None, description="Extra information for the query", validate_default=True)
 
-    @validator("errors", always=True)
-    def check_consistency(cls, v, values):
-        if v is not None and values["data"] is not None:
+    @field_validator("errors")
+    @classmethod
+    def check_consistency(cls, v, info: ValidationInfo):
+        if v is not None and info.data.get("data") is not None:
             raise ValueError("must not provide both data and error")
-        if v is None and values.get("data") is None:
+        if v is None and info.data.get("data") is None:
             raise ValueError("must provide data or error")
         return v
 
-    @validator("meta", pre=True, always=True)
-    def default_meta(cls, v, values):
+    @field_validator("meta", mode="before")
+    @classmethod
+    def default_meta(cls, v, info: ValidationInfo):
         if v is None:
-            v = Meta().dict()
+            v = Meta().model_dump()
         if v.get("total_doc", None) is None:
-            if values.get("data", None) is not None:
-                v["total_doc"] = len(values["data"])
+            if info.data.get("data", None) is not None:
+                v["total_doc"] = len(info.data["data"])
             else:
                 v["total_doc"] = 0
         return v
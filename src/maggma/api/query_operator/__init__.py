@@ -1,6 +1,6 @@
 from maggma.api.query_operator.core import QueryOperator
 from maggma.api.query_operator.dynamic import NumericQuery, StringQueryOperator
-from maggma.api.query_operator.pagination import PaginationQuery
+from maggma.api.query_operator.pagination import KeysetPaginationQuery, PaginationQuery
 from maggma.api.query_operator.sorting import SortQuery
 from maggma.api.query_operator.sparse_fields import SparseFieldsQuery
 from maggma.api.query_operator.submission import SubmissionQuery
@@ -10,6 +10,7 @@ __all__ = [
     "NumericQuery",
     "StringQueryOperator",
     "PaginationQuery",
+    "KeysetPaginationQuery",
     "SortQuery",
     "SparseFieldsQuery",
     "SubmissionQuery",
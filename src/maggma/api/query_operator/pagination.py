@@ -1,8 +1,13 @@
+from bson import ObjectId
+from bson.errors import InvalidId
 from fastapi import HTTPException, Query
 
 from maggma.api.query_operator import QueryOperator
 from maggma.api.utils import STORE_PARAMS
 
+# Converters from the _after query string to the type of a keyset pagination key
+_KEY_TYPES = {"str": str, "int": int, "float": float, "ObjectId": ObjectId}
+
 
 class PaginationQuery(QueryOperator):
     """Query operators to provides Pagination."""
@@ -83,3 +88,84 @@ class PaginationQuery(QueryOperator):
         Metadata for the pagination params.
         """
         return {"max_limit": self.max_limit}
+
+
+class KeysetPaginationQuery(QueryOperator):
+    """
+    Query operators to provide keyset pagination. Rather than skipping over
+    the preceding entries, each page is requested with the last key seen on the
+    previous page so the database can seek straight to it using the key index.
+
+    The seek filter is returned as "seek" rather than merged into "criteria",
+    so resources still report the total number of matching documents. It sorts on
+    the key, so it cannot be combined with SortQuery.
+    """
+
+    def __init__(self, key: str, key_type: str = "str", default_limit: int = 100, max_limit: int = 1000):
+        """
+        Args:
+            key: the indexed field to sort and paginate on
+            key_type: type of the key values, used to convert the _after query
+                parameter. One of "str", "int", "float" or "ObjectId".
+            default_limit: the default number of documents to return
+            max_limit: max number of documents to return.
+        """
+        if key_type not in _KEY_TYPES:
+            raise ValueError(f"key_type must be one of {list(_KEY_TYPES)}, not {key_type!r}")
+
+        self.key = key
+        self.key_type = key_type
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+
+        def query(
+            _after: str = Query(
+                None,
+                description=f"Only return entries with a {key} after this value."
+                f" Use the last {key} of the previous page to get the next page.",
+            ),
+            _limit: int = Query(
+                default_limit,
+                description=f"Max number of entries to return in a single query. Limited to {max_limit}.",
+            ),
+        ) -> STORE_PARAMS:
+            """
+            Keyset pagination parameters for the API Endpoint.
+            """
+            if _limit > max_limit:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Requested more data per query than allowed by this endpoint."
+                    f" The max limit is {max_limit} entries",
+                )
+
+            if _limit < 0:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Cannot request negative _limit values",
+                )
+
+            params: STORE_PARAMS = {"sort": {key: 1}, "limit": _limit}
+
+            if _after is not None:
+                try:
+                    after = _KEY_TYPES[key_type](_after)
+                except (ValueError, InvalidId):
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Cannot interpret _after value {_after!r} as a {key_type}",
+                    )
+                params["seek"] = {key: {"$gt": after}}
+
+            return params
+
+        self.query = query  # type: ignore
+
+    def query(self):
+        """Stub query function for abstract class."""
+
+    def meta(self) -> dict:
+        """
+        Metadata for the pagination params.
+        """
+        return {"max_limit": self.max_limit}
@@ -93,8 +93,8 @@ class AggregationResource(Resource):
             operator_meta = self.pipeline_query_operator.meta()
 
             meta = Meta(total_doc=count)
-            response = {"data": data, "meta": {**meta.dict(), **operator_meta}}
-            response = Response(orjson.dumps(response, default=serialization_helper))  # type: ignore
+            response = {"data": data, "meta": {**meta.model_dump(), **operator_meta}}
+            response = Response(orjson.dumps(response, default=serialization_helper), media_type="application/json")  # type: ignore
 
             if self.header_processor is not None:
                 self.header_processor.process_header(response, request)
@@ -1,16 +1,17 @@
-from inspect import signature
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
-from fastapi import HTTPException, Request
+import orjson
+from fastapi import HTTPException, Request, Response
 from pydantic import BaseModel
 from pymongo import timeout as query_timeout
 from pymongo.errors import NetworkTimeout, PyMongoError
 
-from maggma.api.models import Meta, Response
+from maggma.api.models import Meta
+from maggma.api.models import Response as ResponseModel
 from maggma.api.query_operator import PaginationQuery, QueryOperator, SparseFieldsQuery
 from maggma.api.resource import Resource
-from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline
-from maggma.api.utils import STORE_PARAMS, merge_queries
+from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline, get_query_params, merge_seek
+from maggma.api.utils import STORE_PARAMS, merge_queries, serialization_helper
 from maggma.core import Store
 from maggma.stores import S3Store
 
@@ -29,6 +30,7 @@ class PostOnlyResource(Resource):
         key_fields: Optional[list[str]] = None,
         query: Optional[dict] = None,
         timeout: Optional[int] = None,
+        disable_validation: bool = False,
         include_in_schema: Optional[bool] = True,
         sub_path: Optional[str] = "/",
     ):
@@ -42,6 +44,9 @@ class PostOnlyResource(Resource):
                 to allow user to define these on-the-fly.
             timeout: Time in seconds Pymongo should wait when querying MongoDB
                 before raising a timeout error
+            disable_validation: Whether to use ORJSON and provide a direct FastAPI response.
+                Note this will disable auto JSON serialization and response validation with the
+                provided model.
             include_in_schema: Whether the endpoint should be shown in the documented schema.
             sub_path: sub-URL path for the resource.
         """
@@ -51,10 +56,11 @@ class PostOnlyResource(Resource):
         self.key_fields = key_fields
         self.versioned = False
         self.timeout = timeout
+        self.disable_validation = disable_validation
 
         self.include_in_schema = include_in_schema
         self.sub_path = sub_path
-        self.response_model = Response[model]  # type: ignore
+        self.response_model = ResponseModel[model]  # type: ignore
 
         self.query_operators = (
             query_operators
@@ -79,15 +85,12 @@ class PostOnlyResource(Resource):
 
     def build_dynamic_model_search(self):
         model_name = self.model.__name__
+        query_params = get_query_params(self.query_operators)
 
-        def search(**queries: dict[str, STORE_PARAMS]) -> dict:
+        def search(**queries: dict[str, STORE_PARAMS]) -> Union[dict, Response]:
             request: Request = queries.pop("request")  # type: ignore
             queries.pop("temp_response")  # type: ignore
 
-            query_params = [
-                entry for _, i in enumerate(self.query_operators) for entry in signature(i.query).parameters
-            ]
-
             overlap = [key for key in request.query_params if key not in query_params]
             if any(overlap):
                 raise HTTPException(
@@ -107,16 +110,17 @@ class PostOnlyResource(Resource):
                     )
 
                     if isinstance(self.store, S3Store):
-                        data = list(self.store.query(**query))  # type: ignore
+                        data = list(self.store.query(**merge_seek(query)))  # type: ignore
                     else:
                         pipeline = generate_query_pipeline(query, self.store)
 
-                        data = list(
-                            self.store._collection.aggregate(
-                                pipeline,
-                                **{field: query[field] for field in query if field in ["hint"]},
-                            )
-                        )
+                        agg_kwargs = {field: query[field] for field in query if field in ["hint"]}
+
+                        # Return the whole page in the first batch instead of 101 docs and getMores
+                        if query.get("limit"):
+                            agg_kwargs["batchSize"] = query["limit"]
+
+                        data = list(self.store._collection.aggregate(pipeline, **agg_kwargs))
             except (NetworkTimeout, PyMongoError) as e:
                 if e.timeout:
                     raise HTTPException(
@@ -137,7 +141,12 @@ class PostOnlyResource(Resource):
                 operator_meta.update(operator.meta())
 
             meta = Meta(total_doc=count)
-            return {"data": data, "meta": {**meta.dict(), **operator_meta}}
+            response: Union[dict, Response] = {"data": data, "meta": {**meta.model_dump(), **operator_meta}}
+
+            if self.disable_validation:
+                response = Response(orjson.dumps(response, default=serialization_helper), media_type="application/json")
+
+            return response
 
         self.router.post(
             self.sub_path,
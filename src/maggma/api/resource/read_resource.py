@@ -1,4 +1,3 @@
-from inspect import signature
 from typing import Any, Optional, Union
 
 import orjson
@@ -11,7 +10,7 @@ from maggma.api.models import Meta
 from maggma.api.models import Response as ResponseModel
 from maggma.api.query_operator import PaginationQuery, QueryOperator, SparseFieldsQuery
 from maggma.api.resource import HeaderProcessor, HintScheme, Resource
-from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline
+from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline, get_query_params, merge_seek
 from maggma.api.utils import STORE_PARAMS, merge_queries, serialization_helper
 from maggma.core import Store
 from maggma.stores import MongoStore, S3Store
@@ -141,12 +140,18 @@ class ReadOnlyResource(Resource):
             """
             self.store.connect()
 
+            properties = _fields["properties"]
+            if isinstance(self.store, MongoStore) and isinstance(properties, list) and "_id" not in properties:
+                # _id is not part of the response so don't fetch it, same as the search pipeline.
+                # Other stores treat every key of a dict projection as a field to return
+                properties = {**dict.fromkeys(properties, 1), "_id": 0}
+
             try:
                 with query_timeout(self.timeout):
                     item = [
                         self.store.query_one(
                             criteria={self.store.key: key},
-                            properties=_fields["properties"],
+                            properties=properties,
                         )
                     ]
             except (NetworkTimeout, PyMongoError) as e:
@@ -172,7 +177,7 @@ class ReadOnlyResource(Resource):
             response = {"data": item}  # type: ignore
 
             if self.disable_validation:
-                response = Response(orjson.dumps(response, default=serialization_helper))  # type: ignore
+                response = Response(orjson.dumps(response, default=serialization_helper), media_type="application/json")  # type: ignore
 
             if self.header_processor is not None:
                 if self.disable_validation:
@@ -194,6 +199,8 @@ class ReadOnlyResource(Resource):
 
     def build_dynamic_model_search(self):
         model_name = self.model.__name__
+        # allowed query parameters
+        query_params = get_query_params(self.query_operators)
 
         def search(**queries: dict[str, STORE_PARAMS]) -> Union[dict, Response]:
             request: Request = queries.pop("request")  # type: ignore
@@ -204,10 +211,6 @@ class ReadOnlyResource(Resource):
                 queries["groups"] = self.header_processor.configure_query_on_request(
                     request=request, query_operator=self.query_to_configure_on_request
                 )
-            # allowed query parameters
-            query_params = [
-                entry for _, i in enumerate(self.query_operators) for entry in signature(i.query).parameters
-            ]
             # check for overlap between allowed query parameters and request query parameters
             overlap = [key for key in request.query_params if key not in query_params]
             if any(overlap):
@@ -237,9 +240,9 @@ class ReadOnlyResource(Resource):
                         count = self.store.count(criteria=query.get("criteria"))  # type: ignore
 
                         if self.query_disk_use:
-                            data = list(self.store.query(**query, allow_disk_use=True))  # type: ignore
+                            data = list(self.store.query(**merge_seek(query), allow_disk_use=True))  # type: ignore
                         else:
-                            data = list(self.store.query(**query))
+                            data = list(self.store.query(**merge_seek(query)))
                     else:
                         count = self.store.count(
                             criteria=query.get("criteria"), hint=query.get("count_hint")
@@ -252,6 +255,10 @@ class ReadOnlyResource(Resource):
                         if query.get("agg_hint"):
                             agg_kwargs["hint"] = query["agg_hint"]
 
+                        # Return the whole page in the first batch instead of 101 docs and getMores
+                        if query.get("limit"):
+                            agg_kwargs["batchSize"] = query["limit"]
+
                         data = list(self.store._collection.aggregate(pipeline, **agg_kwargs))
 
             except (NetworkTimeout, PyMongoError) as e:
@@ -275,10 +282,10 @@ class ReadOnlyResource(Resource):
 
             meta = Meta(total_doc=count)
 
-            response = {"data": data, "meta": {**meta.dict(), **operator_meta}}  # type: ignore
+            response = {"data": data, "meta": {**meta.model_dump(), **operator_meta}}  # type: ignore
 
             if self.disable_validation:
-                response = Response(orjson.dumps(response, default=serialization_helper))  # type: ignore
+                response = Response(orjson.dumps(response, default=serialization_helper), media_type="application/json")  # type: ignore
 
             if self.header_processor is not None:
                 if self.disable_validation:
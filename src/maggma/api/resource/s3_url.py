@@ -110,16 +110,17 @@ class S3URLResource(Resource):
             requested_datetime = datetime.utcnow()
             expiry_datetime = requested_datetime + timedelta(seconds=self.url_lifetime)
 
-            item = S3URLDoc(
+            # Every field is generated above, so skip re-validating them
+            item = S3URLDoc.model_construct(
                 url=url,
                 requested_datetime=requested_datetime,
                 expiry_datetime=expiry_datetime,
             )
 
-            response = {"data": [item.dict()]}  # type: ignore
+            response = {"data": [item.model_dump()]}  # type: ignore
 
             if self.disable_validation:
-                response = Response(orjson.dumps(response, default=serialization_helper))  # type: ignore
+                response = Response(orjson.dumps(response, default=serialization_helper), media_type="application/json")  # type: ignore
 
             if self.header_processor is not None:
                 if self.disable_validation:
@@ -1,6 +1,5 @@
 from datetime import datetime
 from enum import Enum
-from inspect import signature
 from typing import Any, Optional
 from uuid import uuid4
 
@@ -12,7 +11,7 @@ from pymongo.errors import NetworkTimeout, PyMongoError
 from maggma.api.models import Meta, Response
 from maggma.api.query_operator import QueryOperator, SubmissionQuery
 from maggma.api.resource import Resource
-from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline
+from maggma.api.resource.utils import attach_query_ops, generate_query_pipeline, get_query_params, merge_seek
 from maggma.api.utils import STORE_PARAMS, merge_queries
 from maggma.core import Store
 from maggma.stores import S3Store
@@ -186,6 +185,7 @@ class SubmissionResource(Resource):
 
     def build_search_data(self):
         model_name = self.model.__name__
+        query_params = get_query_params(self.get_query_operators)
 
         def search(**queries: STORE_PARAMS):
             request: Request = queries.pop("request")  # type: ignore
@@ -193,12 +193,6 @@ class SubmissionResource(Resource):
 
             query: STORE_PARAMS = merge_queries(list(queries.values()))
 
-            query_params = [
-                entry
-                for _, i in enumerate(self.get_query_operators)  # type: ignore
-                for entry in signature(i.query).parameters
-            ]
-
             overlap = [key for key in request.query_params if key not in query_params]
             if any(overlap):
                 raise HTTPException(
@@ -214,16 +208,17 @@ class SubmissionResource(Resource):
                         **{field: query[field] for field in query if field in ["criteria", "hint"]}
                     )
                     if isinstance(self.store, S3Store):
-                        data = list(self.store.query(**query))  # type: ignore
+                        data = list(self.store.query(**merge_seek(query)))  # type: ignore
                     else:
                         pipeline = generate_query_pipeline(query, self.store)
 
-                        data = list(
-                            self.store._collection.aggregate(
-                                pipeline,
-                                **{field: query[field] for field in query if field in ["hint"]},
-                            )
-                        )
+                        agg_kwargs = {field: query[field] for field in query if field in ["hint"]}
+
+                        # Return the whole page in the first batch instead of 101 docs and getMores
+                        if query.get("limit"):
+                            agg_kwargs["batchSize"] = query["limit"]
+
+                        data = list(self.store._collection.aggregate(pipeline, **agg_kwargs))
             except (NetworkTimeout, PyMongoError) as e:
                 if e.timeout:
                     raise HTTPException(
@@ -242,7 +237,7 @@ class SubmissionResource(Resource):
             for operator in self.get_query_operators:  # type: ignore
                 data = operator.post_process(data, query)
 
-            return {"data": data, "meta": meta.dict()}
+            return {"data": data, "meta": meta.model_dump()}
 
         self.router.get(
             self.get_sub_path,
@@ -256,6 +251,7 @@ class SubmissionResource(Resource):
 
     def build_post_data(self):
         model_name = self.model.__name__
+        query_params = get_query_params(self.post_query_operators)
 
         def post_data(**queries: STORE_PARAMS):
             request: Request = queries.pop("request")  # type: ignore
@@ -263,12 +259,6 @@ class SubmissionResource(Resource):
 
             query: STORE_PARAMS = merge_queries(list(queries.values()))
 
-            query_params = [
-                entry
-                for _, i in enumerate(self.post_query_operators)  # type: ignore
-                for entry in signature(i.query).parameters
-            ]
-
             overlap = [key for key in request.query_params if key not in query_params]
             if any(overlap):
                 raise HTTPException(
@@ -324,6 +314,7 @@ class SubmissionResource(Resource):
 
     def build_patch_data(self):
         model_name = self.model.__name__
+        query_params = get_query_params(self.patch_query_operators)  # type: ignore
 
         def patch_data(**queries: STORE_PARAMS):
             request: Request = queries.pop("request")  # type: ignore
@@ -331,12 +322,6 @@ class SubmissionResource(Resource):
 
             query: STORE_PARAMS = merge_queries(list(queries.values()))
 
-            query_params = [
-                entry
-                for _, i in enumerate(self.patch_query_operators)  # type: ignore
-                for entry in signature(i.query).parameters
-            ]
-
             overlap = [key for key in request.query_params if key not in query_params]
             if any(overlap):
                 raise HTTPException(
@@ -1,8 +1,9 @@
+from inspect import signature
 from typing import Callable
 
 from fastapi import Depends, Request, Response
 
-from maggma.api.query_operator import QueryOperator
+from maggma.api.query_operator import KeysetPaginationQuery, QueryOperator, SortQuery
 from maggma.api.utils import STORE_PARAMS, attach_signature
 from maggma.core.store import Store
 
@@ -17,6 +18,12 @@ def attach_query_ops(
     Args:
         function: the function to decorate
     """
+    # Only the last sort survives merge_queries, so another sort would break the keyset order
+    if any(isinstance(op, KeysetPaginationQuery) for op in query_ops) and any(
+        isinstance(op, SortQuery) for op in query_ops
+    ):
+        raise ValueError("KeysetPaginationQuery sorts on its key and cannot be combined with SortQuery")
+
     attach_signature(
         function,
         annotations={
@@ -29,6 +36,31 @@ def attach_query_ops(
     return function
 
 
+def get_query_params(query_ops: list[QueryOperator]) -> set[str]:
+    """
+    Get the names of all query parameters accepted by a list of query operators.
+
+    Args:
+        query_ops: the query operators attached to an endpoint
+    """
+    return {entry for op in query_ops for entry in signature(op.query).parameters}
+
+
+def merge_seek(query: dict) -> dict:
+    """
+    Fold the keyset pagination seek filter into the criteria so the query can be
+    passed straight to Store.query.
+
+    Args:
+        query: Query parameters
+    """
+    query = dict(query)
+    seek = query.pop("seek", None)
+    if seek:
+        query["criteria"] = {"$and": [query["criteria"], seek]}
+    return query
+
+
 def generate_query_pipeline(query: dict, store: Store):
     """
     Generate the generic aggregation pipeline used in GET endpoint queries.
@@ -37,8 +69,9 @@ def generate_query_pipeline(query: dict, store: Store):
         query: Query parameters
         store: Store containing endpoint data
     """
+    # Keyset pagination filters the page without changing the criteria used to count the total
     pipeline = [
-        {"$match": query["criteria"]},
+        {"$match": merge_seek(query)["criteria"]},
     ]
 
     sorting = query.get("sort", False)
@@ -30,6 +30,7 @@ STORE_PARAMS = dict[
         "count_hint",
         "agg_hint",
         "update",
+        "seek",
     ],
     Any,
 ]
@@ -59,6 +59,8 @@ class GroupBuilder(Builder, metaclass=ABCMeta):
         self.grouping_keys = grouping_keys
         self.query = query if query else {}
         self.projection = projection
+        # Build the source projection once and in a stable order for every group query
+        self._projection = sorted({*projection, source.key, source.last_updated_field}) if projection else None
         self.kwargs = kwargs
         self.timeout = timeout
         self.store_process_time = store_process_time
@@ -112,16 +114,11 @@ class GroupBuilder(Builder, metaclass=ABCMeta):
         keys = self.get_ids_to_process()
         groups = self.get_groups_from_keys(keys)
 
-        if self.projection:
-            projection = list({*self.projection, self.source.key, self.source.last_updated_field})
-        else:
-            projection = None
-
         self.total = len(groups)
         for group in groups:
             group_criteria = dict(zip(self.grouping_keys, group))
             group_criteria.update(self.query)
-            yield list(self.source.query(criteria=group_criteria, properties=projection))
+            yield list(self.source.query(criteria=group_criteria, properties=self._projection))
 
     def process_item(self, item: list[dict]) -> dict[tuple, dict]:  # type: ignore
         keys = [d[self.source.key] for d in item]
@@ -10,6 +10,8 @@ from math import ceil
 from time import time
 from typing import Optional
 
+from pydash import get, has
+
 from maggma.core import Builder, Store
 from maggma.utils import Timeout, grouper
 
@@ -58,6 +60,9 @@ class MapBuilder(Builder, metaclass=ABCMeta):
         self.target = target
         self.query = query
         self.projection = projection
+        # Build the source projection once and in a stable order so every
+        # chunk query sends MongoDB an identical projection
+        self._projection = sorted({*projection, source.key, source.last_updated_field}) if projection else None
         self.delete_orphans = delete_orphans
         self.kwargs = kwargs
         self.timeout = timeout
@@ -116,20 +121,23 @@ class MapBuilder(Builder, metaclass=ABCMeta):
             failed_keys = self.target.distinct(self.target.key, criteria=failed_query)
             keys = list(set(keys + failed_keys))
 
-        self.logger.info(f"Processing {len(keys)} items")
+        # Sorting lets each chunk of keys below cover a contiguous range of the source key index
+        try:
+            keys = sorted(keys)
+        except TypeError:
+            pass
 
-        if self.projection:
-            projection = list({*self.projection, self.source.key, self.source.last_updated_field})
-        else:
-            projection = None
+        self.logger.info(f"Processing {len(keys)} items")
 
         self.total = len(keys)
+        # Fetch a whole chunk per batch where the source supports it
+        query_kwargs = self.source.cursor_options(self.chunk_size)
         for chunked_keys in grouper(keys, self.chunk_size):
-            chunked_keys = list(chunked_keys)
             yield from list(
                 self.source.query(
                     criteria={self.source.key: {"$in": chunked_keys}},
-                    properties=projection,
+                    properties=self._projection,
+                    **query_kwargs,
                 )
             )
 
@@ -175,10 +183,10 @@ class MapBuilder(Builder, metaclass=ABCMeta):
         Generic update targets for Map Builder.
         """
         target = self.target
+        build_time = datetime.utcnow()
         for item in items:
-            item["_bt"] = datetime.utcnow()
-            if "_id" in item:
-                del item["_id"]
+            item["_bt"] = build_time
+            item.pop("_id", None)
 
         if len(items) > 0:
             target.update(items)
@@ -188,12 +196,24 @@ class MapBuilder(Builder, metaclass=ABCMeta):
         Finalize MapBuilder operations including removing orphaned documents.
         """
         if self.delete_orphans:
-            source_keyvals = set(self.source.distinct(self.source.key))
-            target_keyvals = set(self.target.distinct(self.target.key))
-            to_delete = list(target_keyvals - source_keyvals)
+            # Stream target keys in chunks and look each chunk up in the source
+            # rather than holding every key of both stores in memory
+            target_keyvals = (
+                get(d, self.target.key)
+                for d in self.target.query(properties=[self.target.key])
+                if has(d, self.target.key)
+            )
+            to_delete = []
+            for chunked_keys in grouper(target_keyvals, self.chunk_size):
+                source_keyvals = set(
+                    self.source.distinct(self.source.key, criteria={self.source.key: {"$in": chunked_keys}})
+                )
+                to_delete.extend(k for k in chunked_keys if k not in source_keyvals)
+
             if len(to_delete):
                 self.logger.info(f"Finalize: Deleting {len(to_delete)} orphans.")
-            self.target.remove_docs({self.target.key: {"$in": to_delete}})
+            for chunked_keys in grouper(to_delete, self.chunk_size):
+                self.target.remove_docs({self.target.key: {"$in": chunked_keys}})
         super().finalize()
 
     @abstractmethod
@@ -209,7 +229,11 @@ class MapBuilder(Builder, metaclass=ABCMeta):
 
 
 class CopyBuilder(MapBuilder):
-    """Sync a source store with a target store."""
+    """
+    Sync a source store with a target store.
+    Whole documents are copied unless a projection is given, in which case
+    only the projected fields are copied to the target.
+    """
 
     def unary_function(self, item):
         """
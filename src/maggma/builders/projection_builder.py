@@ -1,5 +1,4 @@
 from collections.abc import Iterable
-from copy import deepcopy
 from datetime import datetime
 from itertools import chain
 from typing import Optional, Union
@@ -162,7 +161,7 @@ class Projection_Builder(Builder):
                 docs = store.query(criteria={store.key: {"$in": chunked_keys}}, properties=properties)
                 for d in docs:
                     if properties is None:  # all fields are projected as is
-                        item = deepcopy(d)
+                        item = dict(d)
                     else:  # specified fields are renamed
                         item = dict()
                         for k, v in projection.items():
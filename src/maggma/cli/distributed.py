@@ -90,7 +90,7 @@ def manager(url: str, port: int, builders: list[Builder], num_chunks: int, num_w
 
                 msg = bmsg.decode("utf-8")
 
-                if "READY" in msg:
+                if msg.startswith("READY"):
                     if identity not in workers:
                         logger.debug(f"Got connection from worker: {msg.split('_')[1]}")
                         workers[identity] = {
@@ -113,11 +113,11 @@ def manager(url: str, port: int, builders: list[Builder], num_chunks: int, num_w
                                 socket.send_multipart([identity, b"", b"EXIT"])
                                 workers.pop(identity)
 
-                elif "ERROR" in msg:
+                elif msg.startswith("ERROR_"):
                     # Remove worker and requeue work sent to it
                     attempt_graceful_shutdown(workers, socket)
                     raise RuntimeError(
-                        "At least one worker has stopped with error message: {}".format(msg.split("_")[1])
+                        "At least one worker has stopped with error message: {}".format(msg.split("_", 1)[1])
                     )
 
                 elif msg == "PING":
@@ -130,28 +130,29 @@ def manager(url: str, port: int, builders: list[Builder], num_chunks: int, num_w
             if settings.WORKER_TIMEOUT is not None:
                 handle_dead_workers(workers, socket)
 
-            for work_index, chunk_dict in enumerate(chunk_dicts):
-                if not chunk_dict["distributed"]:
-                    temp_builder_dict = dict(**builder_dict)
-                    temp_builder_dict.update(chunk_dict["chunk"])  # type: ignore
-                    temp_builder_dict = jsanitize(temp_builder_dict, recursive_msonable=True)
-
-                    # Send work for available workers
-                    for identity in workers:
-                        if not workers[identity]["working"]:
-                            # Send out a chunk to idle worker
-                            socket.send_multipart(
-                                [
-                                    identity,
-                                    b"",
-                                    json.dumps(temp_builder_dict).encode("utf-8"),
-                                ]
-                            )
-
-                            workers[identity]["work_index"] = work_index
-                            workers[identity]["working"] = True
-                            chunk_dicts[work_index]["distributed"] = True
-                            pbar_distributed.update(1)
+            # Pair each idle worker with the next undistributed chunk so a chunk is only
+            # serialized when it is actually sent, and only ever sent to one worker
+            idle_workers = [identity for identity in workers if not workers[identity]["working"]]
+            undistributed = (work_index for work_index, chunk in enumerate(chunk_dicts) if not chunk["distributed"])
+
+            for identity, work_index in zip(idle_workers, undistributed):
+                temp_builder_dict = dict(**builder_dict)
+                temp_builder_dict.update(chunk_dicts[work_index]["chunk"])  # type: ignore
+                temp_builder_dict = jsanitize(temp_builder_dict, recursive_msonable=True)
+
+                # Send out a chunk to idle worker
+                socket.send_multipart(
+                    [
+                        identity,
+                        b"",
+                        json.dumps(temp_builder_dict).encode("utf-8"),
+                    ]
+                )
+
+                workers[identity]["work_index"] = work_index
+                workers[identity]["working"] = True
+                chunk_dicts[work_index]["distributed"] = True
+                pbar_distributed.update(1)
 
     # Send EXIT to any remaining workers
     logger.info("Sending exit messages to workers once they are done")
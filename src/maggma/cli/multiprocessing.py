@@ -1,19 +1,26 @@
 #!/usr/bin/env python
 # coding utf-8
 
-from asyncio import BoundedSemaphore, Queue, gather, get_event_loop
-from concurrent.futures import ProcessPoolExecutor
+from asyncio import BoundedSemaphore, Queue, create_task, gather, get_event_loop, to_thread
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from functools import partial
+from itertools import chain
 from logging import getLogger
 from types import GeneratorType
 from typing import Any, Callable, Optional
 
 from aioitertools import enumerate
+from monty.json import MontyDecoder
 from tqdm.auto import tqdm
 
-from maggma.utils import primed
+from maggma.utils import dedupe_by_key, primed
+from maggma.utils import grouper as sync_grouper
 
 logger = getLogger("MultiProcessor")
 
+# Builder for the current worker process, set by init_worker
+_worker_builder = None
+
 
 class BackPressure:
     """
@@ -54,12 +61,17 @@ class AsyncUnorderedMap:
     Async iterator that maps a function to an async iterator
     using an executor and returns items as they are done
     This does not guarantee order.
+
+    If on_error is given, it is called with any input whose dispatch raised
+    and its return value is yielded in place of the result. A broken executor
+    is not mapped through on_error but raised from the iterator.
     """
 
-    def __init__(self, func, async_iterator, executor):
+    def __init__(self, func, async_iterator, executor, on_error: Optional[Callable[[Any], Any]] = None):
         self.iterator = async_iterator
         self.func = func
         self.executor = executor
+        self.on_error = on_error
 
         loop = get_event_loop()
 
@@ -68,29 +80,40 @@ class AsyncUnorderedMap:
         self.done_sentinel = object()
         self.results = Queue()
         self.tasks = {}
+        self.error = None
 
-    async def process_and_release(self, idx):
+    async def process_and_release(self, idx, value):
         future = self.tasks[idx]
         try:
             item = await future
             self.results.put_nowait(item)
-        except Exception:
-            pass
+        except BrokenExecutor as e:
+            self.error = e
+            self.results.put_nowait(self.done_sentinel)
+        except Exception as e:
+            if self.on_error is not None:
+                logger.error(e)
+                self.results.put_nowait(self.on_error(value))
         finally:
             self.tasks.pop(idx)
 
     async def get_from_iterator(self):
         loop = get_event_loop()
-        async for idx, item in enumerate(self.iterator):
-            future = loop.run_in_executor(self.executor, safe_dispatch, (self.func, item))
-
-            self.tasks[idx] = future
-            # TODO - line below raises RUF006 error. Unsure about the best way to
-            # resolve. See https://docs.astral.sh/ruff/rules/asyncio-dangling-task/
-            loop.create_task(self.process_and_release(idx))  # noqa: RUF006
-
-        await gather(*self.tasks.values())
-        self.results.put_nowait(self.done_sentinel)
+        try:
+            async for idx, item in enumerate(self.iterator):
+                # A broken executor raises here rather than in the returned future
+                future = loop.run_in_executor(self.executor, safe_dispatch, (self.func, item))
+
+                self.tasks[idx] = future
+                # TODO - line below raises RUF006 error. Unsure about the best way to
+                # resolve. See https://docs.astral.sh/ruff/rules/asyncio-dangling-task/
+                loop.create_task(self.process_and_release(idx, item))  # noqa: RUF006
+
+            # Failed dispatches are handled in process_and_release, so they must not
+            # stop the done sentinel from being sent
+            await gather(*self.tasks.values(), return_exceptions=True)
+        finally:
+            self.results.put_nowait(self.done_sentinel)
 
     def __aiter__(self):
         return self
@@ -99,6 +122,11 @@ class AsyncUnorderedMap:
         item = await self.results.get()
 
         if item == self.done_sentinel:
+            if self.error is not None:
+                self.fill_task.cancel()
+                raise self.error
+            # Raises anything that stopped the iterator from being fully dispatched
+            await self.fill_task
             raise StopAsyncIteration
 
         return item
@@ -132,11 +160,20 @@ async def grouper(async_iterator, n: int):
         chunk.append(item)
         if len(chunk) >= n:
             yield chunk
-            chunk.clear()
+            chunk = []
     if chunk != []:
         yield chunk
 
 
+async def flatten(async_iterator):
+    """
+    Flatten an async iterator of lists into an async iterator of their items.
+    """
+    async for items in async_iterator:
+        for item in items:
+            yield item
+
+
 def safe_dispatch(val):
     func, item = val
     try:
@@ -146,6 +183,30 @@ def safe_dispatch(val):
         return None
 
 
+def init_worker(builder_dict):
+    """
+    Executor initializer that rebuilds the builder in the worker process so it
+    is sent once per worker rather than with every dispatched batch.
+    """
+    global _worker_builder  # noqa: PLW0603
+    _worker_builder = MontyDecoder().process_decoded(builder_dict)
+
+
+def worker_process_item(item):
+    """
+    Processes an item with the builder installed by init_worker.
+    """
+    return _worker_builder.process_item(item)
+
+
+def safe_dispatch_batch(func, items):
+    """
+    Applies func to a batch of items in a single executor call,
+    isolating failures to the item that raised.
+    """
+    return [safe_dispatch((func, item)) for item in items]
+
+
 async def multi(
     builder,
     num_processes,
@@ -154,92 +215,136 @@ async def multi(
     heartbeat_func_kwargs: Optional[dict[Any, Any]] = None,
 ):
     builder.connect()
-    cursor = builder.get_items()
-    executor = ProcessPoolExecutor(num_processes)
 
-    # Gets the total number of items to process by priming
-    # the cursor
-    total = None
+    # Workers decode their own copy of the builder rather than inheriting this
+    # process's open connections, and the pool is shut down however the build ends
+    with ProcessPoolExecutor(num_processes, initializer=init_worker, initargs=(builder.as_dict(),)) as executor:
+        cursor = builder.get_items()
+
+        # Gets the total number of items to process by priming
+        # the cursor
+        total = None
+
+        if isinstance(cursor, GeneratorType):
+            try:
+                cursor = primed(cursor)
+                if hasattr(builder, "total"):
+                    total = builder.total
+            except StopIteration:
+                pass
+
+        elif hasattr(cursor, "__len__"):
+            total = len(cursor)
+        elif hasattr(cursor, "count"):
+            total = cursor.count()
+
+        # Builders that opt in with dedupe_key only need to process the last of the
+        # documents in a chunk that share that key. The Get bar counts every item from
+        # the cursor, but how many are left to process is not known up front
+        source_key = getattr(builder, "dedupe_key", None)
+        cursor = tqdm(cursor, desc="Get", total=total, disable=no_bars)
+        item_total = total
+        if source_key is not None:
+            cursor = chain.from_iterable(
+                dedupe_by_key(chunk, source_key) for chunk in sync_grouper(cursor, builder.chunk_size)
+            )
+            item_total = None
 
-    if isinstance(cursor, GeneratorType):
-        try:
-            cursor = primed(cursor)
-            if hasattr(builder, "total"):
-                total = builder.total
-        except StopIteration:
-            pass
-
-    elif hasattr(cursor, "__len__"):
-        total = len(cursor)
-    elif hasattr(cursor, "count"):
-        total = cursor.count()
-
-    logger.info(
-        f"Starting multiprocessing: {builder.__class__.__name__}",
-        extra={
-            "maggma": {
-                "event": "BUILD_STARTED",
-                "total": total,
-                "builder": builder.__class__.__name__,
-                "sources": [source.name for source in builder.sources],
-                "targets": [target.name for target in builder.targets],
-            }
-        },
-    )
-
-    back_pressured_get = BackPressure(
-        iterator=tqdm(cursor, desc="Get", total=total, disable=no_bars),
-        n=builder.chunk_size,
-    )
-
-    processed_items = atqdm(
-        async_iterator=AsyncUnorderedMap(
-            func=builder.process_item,
-            async_iterator=back_pressured_get,
-            executor=executor,
-        ),
-        total=total,
-        desc="Process Items",
-        disable=no_bars,
-    )
-
-    if not heartbeat_func_kwargs:
-        heartbeat_func_kwargs = {}
-    if heartbeat_func:
-        heartbeat_func(**heartbeat_func_kwargs)
-
-    back_pressure_relief = back_pressured_get.release(processed_items)
-
-    update_items = tqdm(total=total, desc="Update Targets", disable=no_bars)
-
-    async for chunk in grouper(back_pressure_relief, n=builder.chunk_size):
         logger.info(
-            f"Processed batch of {builder.chunk_size} items",
+            f"Starting multiprocessing: {builder.__class__.__name__}",
             extra={
                 "maggma": {
-                    "event": "UPDATE",
-                    "items": len(chunk),
+                    "event": "BUILD_STARTED",
+                    "total": total,
                     "builder": builder.__class__.__name__,
                     "sources": [source.name for source in builder.sources],
                     "targets": [target.name for target in builder.targets],
                 }
             },
         )
-        processed_items = [item for item in chunk if item is not None]
-        builder.update_targets(processed_items)
-        update_items.update(len(processed_items))
-
-    logger.info(
-        f"Ended multiprocessing: {builder.__class__.__name__}",
-        extra={
-            "maggma": {
-                "event": "BUILD_ENDED",
-                "builder": builder.__class__.__name__,
-                "sources": [source.name for source in builder.sources],
-                "targets": [target.name for target in builder.targets],
-            }
-        },
-    )
-
-    update_items.close()
+
+        back_pressured_get = BackPressure(
+            iterator=cursor,
+            n=builder.chunk_size,
+        )
+
+        # Send items to the workers in batches so each round-trip through the pool
+        # carries several items, while keeping enough batches in flight to occupy
+        # every process
+        dispatch_size = max(1, builder.chunk_size // (2 * num_processes))
+
+        processed_items = atqdm(
+            async_iterator=flatten(
+                AsyncUnorderedMap(
+                    func=partial(safe_dispatch_batch, worker_process_item),
+                    async_iterator=grouper(back_pressured_get, n=dispatch_size),
+                    executor=executor,
+                    # A batch that fails in the pool still hands back one result per item
+                    # so that every back-pressure permit taken for it is released. A broken
+                    # pool is raised instead
+                    on_error=lambda batch: [None] * len(batch),
+                )
+            ),
+            total=item_total,
+            desc="Process Items",
+            disable=no_bars,
+        )
+
+        if not heartbeat_func_kwargs:
+            heartbeat_func_kwargs = {}
+        if heartbeat_func:
+            heartbeat_func(**heartbeat_func_kwargs)
+
+        back_pressure_relief = back_pressured_get.release(processed_items)
+
+        update_items = tqdm(total=item_total, desc="Update Targets", disable=no_bars)
+
+        # Builders that opt in with overlap_io have each chunk written in a background
+        # thread so the event loop keeps dispatching and collecting items, waiting on
+        # the previous write so updates stay in order
+        overlap_io = getattr(builder, "overlap_io", False)
+        pending_update, pending_count = None, 0
+
+        async for chunk in grouper(back_pressure_relief, n=builder.chunk_size):
+            logger.info(
+                f"Processed batch of {builder.chunk_size} items",
+                extra={
+                    "maggma": {
+                        "event": "UPDATE",
+                        "items": len(chunk),
+                        "builder": builder.__class__.__name__,
+                        "sources": [source.name for source in builder.sources],
+                        "targets": [target.name for target in builder.targets],
+                    }
+                },
+            )
+            processed_items = [item for item in chunk if item is not None]
+            if not overlap_io:
+                builder.update_targets(processed_items)
+                update_items.update(len(processed_items))
+                continue
+            if pending_update is not None:
+                await pending_update
+                update_items.update(pending_count)
+            pending_update = create_task(to_thread(builder.update_targets, processed_items))
+            pending_count = len(processed_items)
+
+        if pending_update is not None:
+            await pending_update
+            update_items.update(pending_count)
+
+        logger.info(
+            f"Ended multiprocessing: {builder.__class__.__name__}",
+            extra={
+                "maggma": {
+                    "event": "BUILD_ENDED",
+                    "builder": builder.__class__.__name__,
+                    "sources": [source.name for source in builder.sources],
+                    "targets": [target.name for target in builder.targets],
+                }
+            },
+        )
+
+        update_items.close()
+
     builder.finalize()
@@ -6,7 +6,7 @@ import json
 import socket as pysocket
 from logging import getLogger
 from random import randint
-from time import perf_counter
+from time import perf_counter, sleep
 from typing import Literal
 
 import numpy as np
@@ -100,7 +100,7 @@ def manager(
                 msg = body.decode("utf-8")
                 identity = msg.split("_")[-1]
 
-                if "READY" in msg:
+                if msg.startswith("READY"):
                     if identity not in workers:
                         logger.debug(f"Got connection from worker: {msg.split('_')[1]}")
                         workers[identity] = {
@@ -110,48 +110,55 @@ def manager(
                             "work_index": -1,
                         }
 
-                elif "DONE" in msg:
+                elif msg.startswith("DONE"):
                     workers[identity]["working"] = False
                     work_ind = workers[identity]["work_index"]
                     if work_ind != -1:
                         chunk_dicts[work_ind]["completed"] = True  # type: ignore
                         pbar_completed.update(1)
 
-                elif "ERROR" in msg:
+                elif msg.startswith("ERROR"):
                     # Remove worker and requeue work sent to it
                     attempt_graceful_shutdown(connection, workers, channel, worker_queue)
                     raise RuntimeError(
-                        "At least one worker has stopped with error message: {}".format(msg.split("_")[1])
+                        "Worker {} has stopped with error message: {}".format(
+                            identity, msg.split("_", 1)[1].rsplit("_", 1)[0]
+                        )
                     )
 
-                elif "PING" in msg:
+                elif msg.startswith("PING"):
                     # Heartbeat from worker (no pong response)
                     workers[identity]["last_ping"] = perf_counter()
                     workers[identity]["heartbeats"] += 1
 
+            else:
+                # Back off instead of spinning on basic_get while the status queue is empty
+                sleep(0.1)
+
             # Decide if any workers are dead and need to be removed
             handle_dead_workers(connection, workers, channel, worker_queue)
 
-            for work_index, chunk_dict in enumerate(chunk_dicts):
-                if not chunk_dict["distributed"]:
-                    temp_builder_dict = dict(**builder_dict)
-                    temp_builder_dict.update(chunk_dict["chunk"])  # type: ignore
-                    temp_builder_dict = jsanitize(temp_builder_dict, recursive_msonable=True)
-
-                    # Send work for available workers
-                    for identity in workers:
-                        if not workers[identity]["working"]:
-                            # Send out a chunk to idle worker
-                            channel.basic_publish(
-                                exchange="",
-                                routing_key=worker_queue,
-                                body=json.dumps(temp_builder_dict).encode("utf-8"),
-                            )
-
-                            workers[identity]["work_index"] = work_index
-                            workers[identity]["working"] = True
-                            chunk_dicts[work_index]["distributed"] = True
-                            pbar_distributed.update(1)
+            # Pair each idle worker with the next undistributed chunk so a chunk is only
+            # serialized when it is actually published, and only once
+            idle_workers = [identity for identity in workers if not workers[identity]["working"]]
+            undistributed = (work_index for work_index, chunk in enumerate(chunk_dicts) if not chunk["distributed"])
+
+            for identity, work_index in zip(idle_workers, undistributed):
+                temp_builder_dict = dict(**builder_dict)
+                temp_builder_dict.update(chunk_dicts[work_index]["chunk"])  # type: ignore
+                temp_builder_dict = jsanitize(temp_builder_dict, recursive_msonable=True)
+
+                # Send out a chunk to idle worker
+                channel.basic_publish(
+                    exchange="",
+                    routing_key=worker_queue,
+                    body=json.dumps(temp_builder_dict).encode("utf-8"),
+                )
+
+                workers[identity]["work_index"] = work_index
+                workers[identity]["working"] = True
+                chunk_dicts[work_index]["distributed"] = True
+                pbar_distributed.update(1)
 
     # Send EXIT to any remaining workers
     logger.info("Sending exit messages to workers once they are done")
@@ -291,12 +298,16 @@ def worker(url: str, port: int, num_processes: int, no_bars: bool, queue_prefix:
                     # End the worker
                     running = False
 
+            else:
+                # Back off instead of spinning on basic_get while waiting for work
+                sleep(0.1)
+
     except Exception as e:
         logger.error(f"A worker failed with error: {e!r}")
         channel.basic_publish(
             exchange="",
             routing_key=status_queue,
-            body=f"ERROR_{identity}".encode(),
+            body=f"ERROR_{e!r}_{identity}".encode(),
         )
         connection.close()
 
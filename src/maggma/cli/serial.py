@@ -2,17 +2,21 @@
 # coding utf-8
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from types import GeneratorType
 
 from tqdm.auto import tqdm
 
 from maggma.core import Builder
-from maggma.utils import grouper, primed
+from maggma.utils import dedupe_by_key, grouper, primed
 
 
 def serial(builder: Builder, no_bars=False):
     """
     Runs the builders using a single process.
+
+    Builders with overlap_io set have get_items and update_targets run in
+    background threads alongside process_item; all others run one step at a time.
     """
     logger = logging.getLogger("SerialProcessor")
 
@@ -34,6 +38,10 @@ def serial(builder: Builder, no_bars=False):
     elif hasattr(cursor, "count"):
         total = cursor.count()  # type: ignore
 
+    # Builders that opt in with dedupe_key only need to process the last of the
+    # documents in a chunk that share that key
+    source_key = getattr(builder, "dedupe_key", None)
+
     logger.info(
         f"Starting serial processing: {builder.__class__.__name__}",
         extra={
@@ -46,7 +54,8 @@ def serial(builder: Builder, no_bars=False):
             }
         },
     )
-    for chunk in grouper(tqdm(cursor, total=total, disable=no_bars), builder.chunk_size):
+
+    def process_chunk(chunk):
         logger.info(
             f"Processing batch of {builder.chunk_size} items",
             extra={
@@ -57,9 +66,31 @@ def serial(builder: Builder, no_bars=False):
                 }
             },
         )
-        processed_chunk = [builder.process_item(item) for item in chunk]
-        processed_items = [item for item in processed_chunk if item is not None]
-        builder.update_targets(processed_items)
+        processed_chunk = [builder.process_item(item) for item in dedupe_by_key(chunk, source_key)]
+        return [item for item in processed_chunk if item is not None]
+
+    chunks = grouper(tqdm(cursor, total=total, disable=no_bars), builder.chunk_size)
+
+    if not getattr(builder, "overlap_io", False):
+        for chunk in chunks:
+            builder.update_targets(process_chunk(chunk))
+    else:
+        # Write each chunk in a background thread while the next chunk is fetched and
+        # processed, waiting on the previous write so updates stay in order. The next
+        # chunk is pulled from get_items in its own thread so source I/O overlaps with
+        # processing the current chunk
+        with ThreadPoolExecutor(max_workers=1) as update_executor, ThreadPoolExecutor(max_workers=1) as fetch_executor:
+            pending_update = None
+            next_chunk = fetch_executor.submit(next, chunks, None)
+            while (chunk := next_chunk.result()) is not None:
+                next_chunk = fetch_executor.submit(next, chunks, None)
+                processed_items = process_chunk(chunk)
+                if pending_update is not None:
+                    pending_update.result()
+                pending_update = update_executor.submit(builder.update_targets, processed_items)
+
+            if pending_update is not None:
+                pending_update.result()
 
     logger.info(
         f"Ended serial processing: {builder.__class__.__name__}",
@@ -3,7 +3,7 @@ import tempfile
 from typing import Optional
 
 from pydantic import Field
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 tempdir = "/tmp" if platform.system() == "Darwin" else tempfile.gettempdir()
 
@@ -24,6 +24,4 @@ class CLISettings(BaseSettings):
         description="Directory that memory profile .bin files are dumped to",
     )
 
-    class Config:
-        env_prefix = "MAGGMA_"
-        extra = "ignore"
+    model_config = SettingsConfigDict(env_prefix="MAGGMA_", extra="ignore")
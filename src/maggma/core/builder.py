@@ -5,7 +5,7 @@ Module containing the core builder definition.
 import logging
 from abc import ABCMeta, abstractmethod
 from collections.abc import Iterable
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from monty.json import MontyDecoder, MSONable
 
@@ -22,8 +22,20 @@ class Builder(MSONable, metaclass=ABCMeta):
 
     Multiprocessing and MPI processing can be used if all
     the data processing is  limited to process_items
+
+    Builders are not assumed to be thread-safe. Setting overlap_io to True lets the
+    serial and multiprocessing runners call get_items and update_targets from
+    background threads while items are processed, so the builder and its Stores
+    must then tolerate being used from more than one thread at a time.
+
+    Setting dedupe_key to a field name makes the runners keep only the last item
+    per value of that field in each chunk, in cursor order. Only set it when the
+    items for a key are interchangeable.
     """
 
+    overlap_io = False
+    dedupe_key: Optional[str] = None
+
     def __init__(
         self,
         sources: Union[list[Store], Store],
@@ -119,6 +119,17 @@ class Store(MSONable, metaclass=ABCMeta):
             limit: limit on total number of documents returned
         """
 
+    def cursor_options(self, batch_size: int) -> dict:
+        """
+        Extra keyword arguments for query that fetch its results in batches of
+        batch_size documents. Stores that cannot tune their cursors return an
+        empty dict.
+
+        Args:
+            batch_size: number of documents to fetch per batch
+        """
+        return {}
+
     @abstractmethod
     def update(self, docs: Union[list[dict], dict], key: Union[list, str, None] = None):
         """
@@ -165,8 +176,8 @@ class Store(MSONable, metaclass=ABCMeta):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
@@ -196,7 +207,7 @@ class Store(MSONable, metaclass=ABCMeta):
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
         """
-        return next(self.query(criteria=criteria, properties=properties, sort=sort), None)
+        return next(self.query(criteria=criteria, properties=properties, sort=sort, limit=1), None)
 
     def distinct(self, field: str, criteria: Optional[dict] = None, all_exist: bool = False) -> list:
         """
@@ -294,8 +294,8 @@ class AzureBlobStore(Store):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
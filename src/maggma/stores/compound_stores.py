@@ -1,9 +1,10 @@
 """Special stores that combine underlying Stores together."""
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from itertools import groupby
-from typing import Optional, Union
+from itertools import chain, groupby, islice
+from typing import Any, Callable, Optional, Union
 
 from pydash import set_
 from pymongo import MongoClient
@@ -251,7 +252,7 @@ class JointStore(Store):
         skip: int = 0,
         limit: int = 0,
     ) -> Iterator[tuple[dict, list[dict]]]:
-        pipeline = self._get_pipeline(criteria=criteria, properties=properties, skip=skip, limit=limit)
+        pipeline = self._get_pipeline(criteria=criteria, properties=properties)
         if not isinstance(keys, list):
             keys = [keys]
         group_id = {}  # type: Dict[str,Any]
@@ -259,6 +260,14 @@ class JointStore(Store):
             set_(group_id, key, f"${key}")
         pipeline.append({"$group": {"_id": group_id, "docs": {"$push": "$$ROOT"}}})
 
+        # skip and limit page through the groups, which need a stable order to do so
+        if skip > 0 or limit > 0:
+            pipeline.append({"$sort": {"_id": 1}})
+        if skip > 0:
+            pipeline.append({"$skip": skip})
+        if limit > 0:
+            pipeline.append({"$limit": limit})
+
         agg = self._collection.aggregate(pipeline)
 
         for d in agg:
@@ -276,9 +285,7 @@ class JointStore(Store):
         Returns:
             single document
         """
-        # TODO: maybe adding explicit limit in agg pipeline is better as below?
-        # pipeline = self._get_pipeline(properties, criteria)
-        # pipeline.append({"$limit": 1})
+        kwargs["limit"] = 1
         query = self.query(criteria=criteria, properties=properties, **kwargs)
         try:
             return next(query)
@@ -373,6 +380,20 @@ class ConcatStore(Store):
             lus.append(lu)
         return max(lus)
 
+    def _map_stores(self, func: Callable[[Store], Any]) -> list:
+        """
+        Apply a function to every store concurrently so that the round trips
+        to each store overlap rather than run one after another.
+
+        Args:
+            func: function to call with each store
+
+        Returns:
+            the results in the same order as self.stores
+        """
+        with ThreadPoolExecutor(max_workers=max(len(self.stores), 1)) as executor:
+            return list(executor.map(func, self.stores))
+
     def update(self, docs: Union[list[dict], dict], key: Union[list, str, None] = None):
         """
         Update documents into the Store
@@ -395,11 +416,9 @@ class ConcatStore(Store):
             field: the field(s) to get distinct values for
             criteria: PyMongo filter for documents to search in
         """
-        distincts = []
-        for store in self.stores:
-            distincts.extend(store.distinct(field=field, criteria=criteria))
+        distincts = self._map_stores(lambda store: store.distinct(field=field, criteria=criteria))
 
-        return list(set(distincts))
+        return list(set(chain.from_iterable(distincts)))
 
     def ensure_index(self, key: str, unique: bool = False) -> bool:
         """
@@ -421,7 +440,7 @@ class ConcatStore(Store):
         Args:
             criteria: PyMongo filter for documents to count in
         """
-        counts = [store.count(criteria) for store in self.stores]
+        counts = self._map_stores(lambda store: store.count(criteria))
 
         return sum(counts)
 
@@ -444,9 +463,14 @@ class ConcatStore(Store):
             skip: number documents to skip
             limit: limit on total number of documents returned
         """
-        # TODO: skip, sort and limit are broken. implement properly
-        for store in self.stores:
-            yield from store.query(criteria=criteria, properties=properties)
+        # TODO: sort is broken. implement properly
+        # Page through the concatenated stream lazily; no store needs to return
+        # more than skip + limit documents for the page to be complete
+        sub_limit = skip + limit if limit > 0 else 0
+        docs = chain.from_iterable(
+            store.query(criteria=criteria, properties=properties, limit=sub_limit) for store in self.stores
+        )
+        yield from islice(docs, skip, skip + limit if limit > 0 else None)
 
     def groupby(
         self,
@@ -467,8 +491,8 @@ class ConcatStore(Store):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
@@ -484,8 +508,6 @@ class ConcatStore(Store):
                     criteria=criteria,
                     properties=properties,
                     sort=sort,
-                    skip=skip,
-                    limit=limit,
                 )
             )
             for _key, group in temp_docs:
@@ -496,7 +518,8 @@ class ConcatStore(Store):
             return tuple(d.get(k) for k in keys)
 
         sorted_docs = sorted(docs, key=key_set)
-        for vals, group_iter in groupby(sorted_docs, key=key_set):
+        groups = groupby(sorted_docs, key=key_set)
+        for vals, group_iter in islice(groups, skip, skip + limit if limit > 0 else None):
             id_dict = dict(zip(keys, vals))
             yield id_dict, list(group_iter)
 
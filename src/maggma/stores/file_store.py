@@ -462,6 +462,15 @@ class FileStore(MemoryStore):
 
             yield d
 
+    def cursor_options(self, batch_size: int) -> dict:
+        """
+        FileStore.query does not pass extra options on to its cursor.
+
+        Args:
+            batch_size: number of documents to fetch per batch
+        """
+        return {}
+
     def query_one(
         self,
         criteria: Optional[dict] = None,
@@ -486,6 +495,7 @@ class FileStore(MemoryStore):
                 criteria=criteria,
                 properties=properties,
                 sort=sort,
+                limit=1,
                 contents_size_limit=contents_size_limit,
             ),
             None,
@@ -309,8 +309,8 @@ class GridFSStore(Store):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
@@ -320,7 +320,9 @@ class GridFSStore(Store):
         keys = [
             f"metadata.{k}" if k not in files_collection_fields and not k.startswith("metadata.") else k for k in keys
         ]
-        for group, ids in self._files_store.groupby(keys, criteria=criteria, properties=[f"metadata.{self.key}"]):
+        for group, ids in self._files_store.groupby(
+            keys, criteria=criteria, properties=[f"metadata.{self.key}"], skip=skip, limit=limit
+        ):
             ids = [get(doc, f"metadata.{self.key}") for doc in ids if has(doc, f"metadata.{self.key}")]
 
             group = {k.replace("metadata.", ""): get(group, k) for k in keys if has(group, k)}
@@ -6,7 +6,8 @@ various utilities.
 
 import warnings
 from collections.abc import Iterator
-from itertools import chain, groupby
+from datetime import datetime
+from itertools import chain, groupby, islice
 from pathlib import Path
 from typing import Any, Callable, Literal, Optional, Union
 
@@ -18,11 +19,11 @@ from monty.io import zopen
 from monty.json import jsanitize
 from monty.serialization import loadfn
 from pydash import get, has, set_
-from pymongo import MongoClient, ReplaceOne, uri_parser
+from pymongo import CursorType, MongoClient, ReplaceOne, uri_parser
 from pymongo.errors import ConfigurationError, DocumentTooLarge, OperationFailure
 from ruamel.yaml import YAML
 
-from maggma.core import Sort, Store, StoreError
+from maggma.core import DateTimeFormat, Sort, Store, StoreError
 from maggma.stores.ssh_tunnel import SSHTunnel
 from maggma.utils import confirm_field_index, to_dt
 
@@ -173,14 +174,119 @@ class MongoStore(Store):
         try:
             distinct_vals = self._collection.distinct(field, criteria)
         except (OperationFailure, DocumentTooLarge):
+            # High-cardinality fields can exceed the in-memory $group limit, so allow spilling to disk
             distinct_vals = [
-                d["_id"] for d in self._collection.aggregate([{"$match": criteria}, {"$group": {"_id": f"${field}"}}])
+                d["_id"]
+                for d in self._collection.aggregate(
+                    [{"$match": criteria}, {"$group": {"_id": f"${field}"}}], allowDiskUse=True
+                )
             ]
             if all(isinstance(d, list) for d in filter(None, distinct_vals)):  # type: ignore
                 distinct_vals = list(chain.from_iterable(filter(None, distinct_vals)))
 
         return distinct_vals if distinct_vals is not None else []
 
+    def newer_in(self, target: Store, criteria: Optional[dict] = None, exhaustive: bool = False) -> list[str]:
+        """
+        Returns the keys of documents that are newer in the target
+        Store than this Store.
+
+        If both stores are collections in the same MongoDB database, the exhaustive
+        check is done on the server with a $lookup instead of pulling every key and
+        last_updated value from both collections.
+
+        Args:
+            target: target Store to
+            criteria: PyMongo filter for documents to search in
+            exhaustive: triggers an item-by-item check vs. checking
+                        the last_updated of the target Store and using
+                        that to filter out new items in
+        """
+        if not (exhaustive and self._shares_database(target)):
+            return super().newer_in(target, criteria=criteria, exhaustive=exhaustive)
+
+        self.ensure_index(self.key)
+        self.ensure_index(self.last_updated_field)
+
+        # $lookup can only combine localField/foreignField with a pipeline from MongoDB 5.0
+        project_lookup = self._collection.database.client.server_info()["versionArray"] >= [5]
+
+        try:
+            return [
+                d["_id"]
+                for d in target._collection.aggregate(  # type: ignore
+                    self._newer_in_pipeline(target, criteria, project_lookup=project_lookup), allowDiskUse=True
+                )
+            ]
+        except OperationFailure:
+            # e.g. a $lookup into a sharded collection, which MongoDB only supports from 5.1
+            return super().newer_in(target, criteria=criteria, exhaustive=exhaustive)
+
+    def _newer_in_pipeline(
+        self, target: Store, criteria: Optional[dict] = None, project_lookup: bool = True
+    ) -> list[dict]:
+        """
+        Aggregation pipeline run on the target collection by newer_in to find the
+        keys that are missing from, or newer than, the documents in this Store.
+
+        The $lookup joins on localField/foreignField rather than a let/pipeline
+        $expr match, so it can use the index on this Store's key. With project_lookup
+        the joined documents are cut down to their last_updated value, which needs
+        MongoDB 5.0; older servers join whole documents.
+        """
+        lu = self.last_updated_field
+        lookup = {
+            "from": self.collection_name,
+            "localField": target.key,
+            "foreignField": self.key,
+            "as": "_self",
+        }
+        if project_lookup:
+            lookup["pipeline"] = [{"$project": {"_id": 0, lu: 1}}]
+
+        return [
+            {"$match": criteria or {}},
+            {"$project": {"_id": 0, target.key: 1, target.last_updated_field: 1}},
+            {"$lookup": lookup},
+            {
+                "$project": {
+                    target.key: 1,
+                    target.last_updated_field: 1,
+                    "_n": {"$size": "$_self"},
+                    # documents without a last_updated value are never out of date
+                    "_lu": {
+                        "$max": {"$map": {"input": "$_self", "as": "s", "in": {"$ifNull": [f"$$s.{lu}", datetime.max]}}}
+                    },
+                }
+            },
+            {
+                "$match": {
+                    "$expr": {
+                        "$or": [
+                            {"$eq": ["$_n", 0]},
+                            {"$gt": [f"${target.last_updated_field}", "$_lu"]},
+                        ]
+                    }
+                }
+            },
+            {"$group": {"_id": f"${target.key}"}},
+        ]
+
+    def _shares_database(self, other: Store) -> bool:
+        """
+        Whether another Store is a plain MongoStore collection in the same database
+        as this one, with last_updated values stored as datetimes in both.
+        """
+        return (
+            type(self) is MongoStore
+            and type(other) is MongoStore
+            and self.ssh_tunnel is None
+            and other.ssh_tunnel is None
+            and (self.host, self.port, self.database) == (other.host, other.port, other.database)
+            and DateTimeFormat(self.last_updated_type) == DateTimeFormat.DateTime
+            and DateTimeFormat(other.last_updated_type) == DateTimeFormat.DateTime
+        )
+
     def groupby(
         self,
         keys: Union[list[str], str],
@@ -192,7 +298,8 @@ class MongoStore(Store):
     ) -> Iterator[tuple[dict, list[dict]]]:
         """
         Simple grouping function that will group documents
-        by keys.
+        by keys. When skip or limit is set, the groups are returned
+        in ascending order of their keys so that pages are stable.
 
         Args:
             keys: fields to group documents
@@ -200,8 +307,8 @@ class MongoStore(Store):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (key, list of docs)
@@ -224,6 +331,16 @@ class MongoStore(Store):
         alpha = "abcdefghijklmnopqrstuvwxyz"
         group_id = {letter: f"${key}" for letter, key in zip(alpha, keys)}
         pipeline.append({"$group": {"_id": group_id, "docs": {"$push": "$$ROOT"}}})
+
+        # Page through the groups on the server so only the requested ones are returned.
+        # Paging needs a stable order, so groups come back sorted by key when skip or limit is set
+        if skip > 0 or limit > 0:
+            pipeline.append({"$sort": {"_id": 1}})
+        if skip > 0:
+            pipeline.append({"$skip": skip})
+        if limit > 0:
+            pipeline.append({"$limit": limit})
+
         for d in self._collection.aggregate(pipeline, allowDiskUse=True):
             id_doc = {}  # type: ignore
             for letter, key in group_id.items():
@@ -338,6 +455,20 @@ class MongoStore(Store):
             **kwargs,
         )
 
+    def cursor_options(self, batch_size: int) -> dict:
+        """
+        Extra keyword arguments for query that fetch its results in batches of
+        batch_size documents. A direct mongod also streams the batches with an
+        exhaust cursor to avoid getMore round-trips, which mongos does not support.
+
+        Args:
+            batch_size: number of documents to fetch per batch
+        """
+        options = {"batch_size": batch_size}
+        if self._collection.database.client.is_mongos is False:
+            options["cursor_type"] = CursorType.EXHAUST
+        return options
+
     def ensure_index(self, key: str, unique: Optional[bool] = False) -> bool:
         """
         Tries to create an index and return true if it succeeded.
@@ -374,6 +505,9 @@ class MongoStore(Store):
         if not isinstance(docs, list):
             docs = [docs]
 
+        key = key or self.key
+        keys = key if isinstance(key, list) else [key]
+
         for d in (jsanitize(x, allow_bson=True, recursive_msonable=True) for x in docs):
             # document-level validation is optional
             validates = True
@@ -385,8 +519,7 @@ class MongoStore(Store):
                     self.logger.error(self.validator.validation_errors(d))
 
             if validates:
-                key = key or self.key
-                search_doc = {k: d[k] for k in key} if isinstance(key, list) else {key: d[key]}
+                search_doc = {k: d[k] for k in keys}
 
                 requests.append(ReplaceOne(search_doc, d, upsert=True))
 
@@ -563,8 +696,8 @@ class MemoryStore(MongoStore):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (key, list of elements)
@@ -583,7 +716,8 @@ class MemoryStore(MongoStore):
         def grouping_keys(doc):
             return tuple(get(doc, k) for k in keys)
 
-        for vals, group in groupby(sorted(data, key=grouping_keys), key=grouping_keys):
+        groups = groupby(sorted(data, key=grouping_keys), key=grouping_keys)
+        for vals, group in islice(groups, skip, skip + limit if limit > 0 else None):
             doc = {}  # type: ignore
             for k, v in zip(keys, vals):
                 set_(doc, k, v)
@@ -904,6 +1038,15 @@ class MontyStore(MemoryStore):
 
         return self._collection.count_documents(filter=criteria)
 
+    def cursor_options(self, batch_size: int) -> dict:
+        """
+        MontyDB cursors do not take batch or cursor type options.
+
+        Args:
+            batch_size: number of documents to fetch per batch
+        """
+        return {}
+
     def update(self, docs: Union[list[dict], dict], key: Union[list, str, None] = None):
         """
         Update documents into the Store.
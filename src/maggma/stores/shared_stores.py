@@ -171,8 +171,8 @@ class StoreFacade(Store):
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
@@ -481,8 +481,8 @@ class MultiStore:
             properties: properties to return in grouped documents
             sort: Dictionary of sort order for fields. Keys are field names and
                 values are 1 for ascending or -1 for descending.
-            skip: number documents to skip
-            limit: limit on total number of documents returned
+            skip: number of groups to skip
+            limit: limit on total number of groups returned
 
         Returns:
             generator returning tuples of (dict, list of docs)
@@ -520,6 +520,7 @@ class MultiStore:
                 values are 1 for ascending or -1 for descending.
         """
         store_id = self.get_store_index(store)
+        kwargs["limit"] = 1
         return next(
             self._stores[store_id].query(criteria=criteria, properties=properties, sort=sort, **kwargs),
             None,
@@ -4,10 +4,12 @@ Utilities to help with maggma functions.
 
 import itertools
 import logging
+import re
 import signal
 import uuid
 from collections.abc import Iterable
 from datetime import datetime, timedelta
+from functools import cache
 from importlib import import_module
 from typing import Optional, Union
 
@@ -88,9 +90,18 @@ def to_isoformat_ceil_ms(dt: Union[datetime, str]) -> str:
     return None
 
 
+# Datetime strings as maggma writes them, from isoformat() or str() of a datetime,
+# which datetime.fromisoformat parses to the same value as dateutil
+_ISO_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(\.\d{3}|\.\d{6})?([+-]\d{2}:\d{2})?", re.ASCII)
+
+
 def to_dt(s: Union[datetime, str]) -> datetime:
     """Convert an ISO 8601 string to a datetime."""
     if isinstance(s, str):
+        # Strings in the formats maggma writes take the fast path, anything
+        # else goes through the more lenient dateutil parser
+        if _ISO_DATETIME.fullmatch(s):
+            return datetime.fromisoformat(s)
         return parser.parse(s)
     if isinstance(s, datetime):
         return s
@@ -135,6 +146,31 @@ def grouper(iterable: Iterable, n: int) -> Iterable:
     return iter(lambda: list(itertools.islice(iterable, n)), [])
 
 
+def dedupe_by_key(items: Iterable, key: Optional[str]) -> list:
+    """
+    Drop all but the last of the documents that share the same value for key.
+    Items that are not dictionaries, are missing the key, or have an unhashable
+    value for it are kept as is.
+
+    Args:
+        items: iterable of items, typically a chunk of documents from get_items
+        key: the document key to deduplicate on, no deduplication if None
+    """
+    if key is None:
+        return list(items)
+
+    unique: dict = {}
+    for i, item in enumerate(items):
+        if isinstance(item, dict) and key in item:
+            try:
+                unique[(True, item[key])] = item
+                continue
+            except TypeError:
+                pass
+        unique[(False, i)] = item
+    return list(unique.values())
+
+
 def lazy_substitute(d: dict, aliases: dict):
     """
     Simple top level substitute that doesn't dive into mongo like strings.
@@ -207,9 +243,12 @@ class Timeout:
             signal.alarm(0)
 
 
+@cache
 def dynamic_import(abs_module_path: str, class_name: Optional[str] = None):
     """
     Dynamic class importer from: https://www.bnmetrics.com/blog/dynamic-import-in-python3.
+    Results are cached since the same models are resolved every time a resource
+    or query operator is deserialized.
     """
     if class_name is None:
         class_name = abs_module_path.split(".")[-1]
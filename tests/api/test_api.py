@@ -1,4 +1,5 @@
 import json
+import warnings
 from enum import Enum
 from random import choice, randint
 from typing import Any
@@ -74,6 +75,20 @@ def test_msonable(owner_store, pet_store):
         assert k in api_dict
 
 
+def test_heartbeat_response(owner_store):
+    api = API({"owners": [ReadOnlyResource(owner_store, Owner)]}, heartbeat_meta={})
+    client = TestClient(api.app)
+
+    # The default response class must not trigger FastAPI deprecation warnings
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        res = client.get("/heartbeat")
+
+    assert res.status_code == 200
+    assert res.json()["status"] == "OK"
+    assert not [w for w in caught if "ORJSONResponse" in str(w.message)]
+
+
 def search_helper(payload, base: str = "/?", debug=True) -> tuple[Response, Any]:
     """
     Helper function to directly query search endpoints
@@ -61,6 +61,19 @@ def test_post_to_search(owner_store):
     assert client.post("/").status_code == 200
 
 
+def test_post_to_search_disable_validation(owner_store):
+    endpoint = PostOnlyResource(owner_store, Owner, disable_validation=True)
+    app = FastAPI()
+    app.include_router(endpoint.router)
+
+    client = TestClient(app)
+
+    res = client.post("/")
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/json"
+    assert res.json()["meta"]["total_doc"] == total_owners
+
+
 @pytest.mark.xfail()
 def test_problem_query_params(owner_store):
     endpoint = PostOnlyResource(owner_store, Owner)
@@ -2,12 +2,13 @@ from datetime import datetime
 from enum import Enum
 
 import pytest
+from bson import ObjectId
 from fastapi import HTTPException
 from monty.serialization import dumpfn, loadfn
 from monty.tempfile import ScratchDir
 from pydantic import BaseModel, Field
 
-from maggma.api.query_operator import NumericQuery, PaginationQuery, SortQuery, SparseFieldsQuery
+from maggma.api.query_operator import KeysetPaginationQuery, NumericQuery, PaginationQuery, SortQuery, SparseFieldsQuery
 from maggma.api.query_operator.submission import SubmissionQuery
 
 
@@ -56,6 +57,53 @@ def test_pagination_serialization():
         }
 
 
+def test_keyset_pagination_functionality():
+    op = KeysetPaginationQuery(key="task_id")
+
+    assert op.query(_after=None, _limit=20) == {"sort": {"task_id": 1}, "limit": 20}
+    assert op.query(_after="mp-10", _limit=20) == {
+        "seek": {"task_id": {"$gt": "mp-10"}},
+        "sort": {"task_id": 1},
+        "limit": 20,
+    }
+    assert op.meta() == {"max_limit": 1000}
+
+    with pytest.raises(HTTPException):
+        op.query(_after=None, _limit=10000)
+
+    with pytest.raises(HTTPException):
+        op.query(_after=None, _limit=-1)
+
+    with ScratchDir("."):
+        dumpfn(op, "temp.json")
+        new_op = loadfn("temp.json")
+        assert new_op.query(_after="mp-10", _limit=20)["seek"] == {"task_id": {"$gt": "mp-10"}}
+
+
+def test_keyset_pagination_key_type():
+    # Query parameters arrive as strings, so _after is converted to the key's type
+    op = KeysetPaginationQuery(key="task_id", key_type="int")
+    assert op.query(_after="10", _limit=20)["seek"] == {"task_id": {"$gt": 10}}
+
+    with pytest.raises(HTTPException):
+        op.query(_after="mp-10", _limit=20)
+
+    op = KeysetPaginationQuery(key="_id", key_type="ObjectId")
+    oid = ObjectId()
+    assert op.query(_after=str(oid), _limit=20)["seek"] == {"_id": {"$gt": oid}}
+
+    with pytest.raises(HTTPException):
+        op.query(_after="not-an-id", _limit=20)
+
+    with pytest.raises(ValueError, match="key_type"):
+        KeysetPaginationQuery(key="task_id", key_type="datetime")
+
+    with ScratchDir("."):
+        dumpfn(KeysetPaginationQuery(key="task_id", key_type="int"), "temp.json")
+        new_op = loadfn("temp.json")
+        assert new_op.query(_after="10", _limit=20)["seek"] == {"task_id": {"$gt": 10}}
+
+
 def test_sparse_query_functionality():
     op = SparseFieldsQuery(model=Owner)
 
@@ -3,16 +3,24 @@ from datetime import datetime
 from random import randint
 from urllib.parse import urlencode
 
+import boto3
 import pytest
 from fastapi import FastAPI
+from moto import mock_aws
 from pydantic import BaseModel, Field
 from requests import Response
 from starlette.testclient import TestClient
 
-from maggma.api.query_operator import NumericQuery, SparseFieldsQuery, StringQueryOperator
+from maggma.api.query_operator import (
+    KeysetPaginationQuery,
+    NumericQuery,
+    SortQuery,
+    SparseFieldsQuery,
+    StringQueryOperator,
+)
 from maggma.api.resource import ReadOnlyResource
 from maggma.api.resource.core import HeaderProcessor, HintScheme
-from maggma.stores import AliasingStore, MemoryStore
+from maggma.stores import AliasingStore, MemoryStore, S3Store
 
 
 class Owner(BaseModel):
@@ -85,6 +93,30 @@ def test_get_by_key(owner_store):
 
     assert client.get("/Person1/").status_code == 200
     assert client.get("/Person1/").json()["data"][0]["name"] == "Person1"
+    assert client.get("/Person1/").headers["content-type"] == "application/json"
+    assert "_id" not in client.get("/Person1/").json()["data"][0]
+
+
+def test_get_by_key_s3_store():
+    with mock_aws():
+        conn = boto3.resource("s3", region_name="us-east-1")
+        conn.create_bucket(Bucket="bucket1")
+
+        store = S3Store(MemoryStore("index", key="name"), "bucket1", key="name")
+        store.connect()
+        store.update([d.dict() for d in owners])
+
+        endpoint = ReadOnlyResource(
+            store, Owner, disable_validation=True, enable_get_by_key=True, enable_default_search=False
+        )
+        app = FastAPI()
+        app.include_router(endpoint.router)
+
+        client = TestClient(app)
+
+        res = client.get("/Person1/?_fields=name")
+        assert res.status_code == 200
+        assert res.json()["data"] == [{"name": "Person1"}]
 
 
 def test_key_fields(owner_store):
@@ -230,6 +262,61 @@ def test_resource_compound():
     assert "weight" not in data[0]
 
 
+def test_keyset_pagination(owner_store):
+    endpoint = ReadOnlyResource(
+        owner_store,
+        Owner,
+        query_operators=[KeysetPaginationQuery(key="weight", key_type="float"), SparseFieldsQuery(model=Owner)],
+        disable_validation=True,
+    )
+    app = FastAPI()
+    app.include_router(endpoint.router)
+    client = TestClient(app)
+
+    res = client.get("/?" + urlencode({"_after": 105, "_limit": 3, "_all_fields": True}))
+    assert res.status_code == 200
+    assert [d["weight"] for d in res.json()["data"]] == [106, 107, 108]
+    # The total counts every matching document, not just those after the cursor
+    assert res.json()["meta"]["total_doc"] == total_owners
+
+    res = client.get("/?" + urlencode({"_after": "heavy"}))
+    assert res.status_code == 400
+
+
+def test_keyset_pagination_s3_store():
+    with mock_aws():
+        conn = boto3.resource("s3", region_name="us-east-1")
+        conn.create_bucket(Bucket="bucket1")
+
+        store = S3Store(MemoryStore("index", key="name"), "bucket1", key="name", searchable_fields=["weight"])
+        store.connect()
+        store.update([d.dict() for d in owners])
+
+        endpoint = ReadOnlyResource(
+            store,
+            Owner,
+            query_operators=[KeysetPaginationQuery(key="weight", key_type="float"), SparseFieldsQuery(model=Owner)],
+            disable_validation=True,
+        )
+        app = FastAPI()
+        app.include_router(endpoint.router)
+        client = TestClient(app)
+
+        res = client.get("/?" + urlencode({"_after": 105, "_limit": 3, "_all_fields": True}))
+        assert res.status_code == 200
+        assert [d["weight"] for d in res.json()["data"]] == [106, 107, 108]
+        assert res.json()["meta"]["total_doc"] == total_owners
+
+
+def test_keyset_pagination_with_sort(owner_store):
+    with pytest.raises(ValueError, match="SortQuery"):
+        ReadOnlyResource(
+            owner_store,
+            Owner,
+            query_operators=[KeysetPaginationQuery(key="weight", key_type="float"), SortQuery()],
+        )
+
+
 def test_configure_query_on_request():
     payload = {
         "name": "PersonAge20Weight200",
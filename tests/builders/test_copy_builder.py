@@ -3,6 +3,7 @@ Tests for MapBuilder
 """
 
 from datetime import datetime, timedelta
+from unittest import mock
 
 import pytest
 
@@ -60,6 +61,7 @@ def test_get_items(source, target, old_docs, some_failed_old_docs):
     assert len(list(builder.get_items())) == 0
 
     builder = CopyBuilder(source, target, projection=["k"])
+    assert builder._projection == ["k", "lu"]
     target.remove_docs({})
     assert len(list(builder.get_items())) == len(old_docs)
     assert all("v" not in d for d in builder.get_items())
@@ -87,6 +89,18 @@ def test_process_item(source, target, old_docs):
     items = list(builder.get_items())
     assert len(items) == len(list(map(builder.process_item, items)))
 
+    # Chunks are only deduplicated by builders that opt in
+    assert builder.dedupe_key is None
+
+
+def test_source_cursor_options(source, target, old_docs):
+    # Source chunks are fetched with the cursor options the source store reports
+    builder = CopyBuilder(source, target, chunk_size=5)
+    source.update(old_docs)
+    with mock.patch.object(source, "query", wraps=source.query) as query:
+        assert len(list(builder.get_items())) == len(old_docs)
+    assert query.call_args.kwargs["batch_size"] == 5
+
 
 def test_update_targets(source, target, old_docs, new_docs):
     builder = CopyBuilder(source, target)
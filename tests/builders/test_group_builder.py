@@ -76,3 +76,12 @@ def test_grouping(source, target, docs):
     builder.update_targets(processed)
 
     assert len(builder.get_ids_to_process()) == 0, f"{len(builder.get_ids_to_process())} != 0"
+
+
+def test_grouping_projection(source, target):
+    builder = DummyGrouper(source, target, grouping_keys=["a"], projection=["a", "b"])
+    assert builder._projection == ["a", "b", "k", "lu"]
+
+    to_process = list(builder.get_items())
+    assert len(to_process) == 3
+    assert all(set(d.keys()) <= {"_id", "a", "b", "k", "lu"} for group in to_process for d in group)
@@ -103,6 +103,32 @@ async def test_manager_worker_error(log_to_stdout):
     manager_thread.join()
 
 
+@pytest.mark.asyncio()
+async def test_manager_worker_error_mentioning_ready(log_to_stdout):
+    errors = []
+
+    def run_manager():
+        try:
+            manager(SERVER_URL, SERVER_PORT, [DummyBuilder(dummy_prechunk=False)], 10, 1)
+        except RuntimeError as e:
+            errors.append(e)
+
+    manager_thread = threading.Thread(target=run_manager)
+    manager_thread.start()
+
+    context = zmq.Context()
+    socket = context.socket(REQ)
+    socket.connect(f"{SERVER_URL}:{SERVER_PORT}")
+
+    # An error whose message happens to contain READY must not register a worker
+    await socket.send(b"ERROR_worker was never READY")
+    await asyncio.sleep(1)
+
+    manager_thread.join(timeout=5)
+    assert not manager_thread.is_alive()
+    assert "worker was never READY" in str(errors[0])
+
+
 @pytest.mark.asyncio()
 async def test_worker_error():
     context = zmq.Context()
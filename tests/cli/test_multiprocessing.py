@@ -1,9 +1,22 @@
+import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import pytest
 
-from maggma.cli.multiprocessing import AsyncUnorderedMap, BackPressure, grouper, safe_dispatch
+from maggma.cli.multiprocessing import (
+    AsyncUnorderedMap,
+    BackPressure,
+    flatten,
+    grouper,
+    init_worker,
+    multi,
+    safe_dispatch,
+    safe_dispatch_batch,
+    worker_process_item,
+)
+from maggma.core import Builder
 
 
 @pytest.mark.asyncio()
@@ -71,8 +84,139 @@ async def test_async_map():
     assert finished_vals == true_values
 
 
+class FailingExecutor(ThreadPoolExecutor):
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_exception(RuntimeError("broken pool"))
+        return future
+
+
+@pytest.mark.asyncio()
+async def test_async_map_on_error():
+    amap = AsyncUnorderedMap(wait_and_return, arange(3), FailingExecutor(1), on_error=lambda x: -x)
+
+    assert {val async for val in amap} == {0, -1, -2}
+
+
+class BrokenPoolExecutor(ThreadPoolExecutor):
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenExecutor("broken pool")
+
+
+@pytest.mark.asyncio()
+async def test_async_map_broken_executor():
+    amap = AsyncUnorderedMap(wait_and_return, arange(3), BrokenPoolExecutor(1), on_error=lambda x: -x)
+
+    with pytest.raises(BrokenExecutor):
+        [val async for val in amap]
+
+
 def test_safe_dispatch():
     def bad_func(val):
         raise ValueError("AAAH")
 
     safe_dispatch((bad_func, ""))
+
+
+def test_safe_dispatch_batch():
+    def invert(val):
+        return 1 / val
+
+    assert safe_dispatch_batch(invert, [1, 0, 2]) == [1.0, None, 0.5]
+
+
+def test_worker_builder():
+    with ProcessPoolExecutor(1, initializer=init_worker, initargs=(ListBuilder().as_dict(),)) as executor:
+        assert list(executor.map(worker_process_item, range(4))) == [0, 1, 4, 9]
+
+
+@pytest.mark.asyncio()
+async def test_flatten():
+    assert [item async for item in flatten(grouper(arange(25), n=10))] == list(range(25))
+
+
+class ListBuilder(Builder):
+    def __init__(self, total=25, overlap_io=False):
+        super().__init__(sources=[], targets=[], chunk_size=10)
+        self.total = total
+        self.overlap_io = overlap_io
+        self.updated = []
+
+    def get_items(self):
+        yield from range(self.total)
+
+    def process_item(self, item):
+        return item * item
+
+    def update_targets(self, items):
+        self.updated.extend(items)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.parametrize("overlap_io", [False, True])
+async def test_multi(overlap_io):
+    builder = ListBuilder(overlap_io=overlap_io)
+    await multi(builder, num_processes=2, no_bars=True)
+    assert sorted(builder.updated) == [i * i for i in range(25)]
+
+
+class FailingBuilder(ListBuilder):
+    def process_item(self, item):
+        if item % 2:
+            raise ValueError("odd item")
+        return item * item
+
+
+@pytest.mark.asyncio()
+async def test_multi_process_item_error():
+    builder = FailingBuilder()
+    await multi(builder, num_processes=2, no_bars=True)
+    assert sorted(builder.updated) == [i * i for i in range(0, 25, 2)]
+
+
+class UnpicklableBuilder(ListBuilder):
+    def get_items(self):
+        # Items that cannot be sent to the pool fail their whole batch
+        for _ in range(self.total):
+            yield lambda: None
+
+
+@pytest.mark.asyncio()
+async def test_multi_failed_batches_release_back_pressure():
+    builder = UnpicklableBuilder()
+    await asyncio.wait_for(multi(builder, num_processes=2, no_bars=True), timeout=30)
+    assert builder.updated == []
+
+
+class UndecodableBuilder(ListBuilder):
+    @classmethod
+    def from_dict(cls, d):
+        raise ValueError("cannot rebuild builder")
+
+
+@pytest.mark.asyncio()
+async def test_multi_broken_pool():
+    # Workers that fail to start break the pool, which fails the build instead of hanging it
+    builder = UndecodableBuilder()
+    with pytest.raises(BrokenProcessPool):
+        await asyncio.wait_for(multi(builder, num_processes=2, no_bars=True), timeout=30)
+    assert builder.updated == []
+
+
+class DedupeListBuilder(ListBuilder):
+    dedupe_key = "k"
+
+    def get_items(self):
+        for i in range(self.total):
+            yield {"k": i // 2, "v": i}
+
+    def process_item(self, item):
+        return item["v"]
+
+
+@pytest.mark.asyncio()
+async def test_multi_dedupe():
+    # Only the last item per key in each chunk is processed
+    builder = DedupeListBuilder(total=20)
+    await multi(builder, num_processes=2, no_bars=True)
+    assert sorted(builder.updated) == list(range(1, 20, 2))
@@ -30,3 +30,36 @@ def test_serial():
     assert builder.get_called == 10
     assert builder.process_called == 10
     assert builder.update_called == 1
+
+
+class OverlapBuilder(TestBuilder):
+    overlap_io = True
+
+
+def test_serial_overlap_io():
+    # Builders that opt in with overlap_io fetch and write chunks in background threads
+    builder = OverlapBuilder(total=25)
+    builder.chunk_size = 10
+
+    serial(builder)
+    assert builder.get_called == 25
+    assert builder.process_called == 25
+    assert builder.update_called == 3
+
+
+class DedupeBuilder(TestBuilder):
+    dedupe_key = "k"
+
+    def get_items(self):
+        for _i in range(self.total):
+            self.get_called += 1
+            yield {"k": self.get_called % 2}
+
+
+def test_serial_dedupe():
+    # Only builders that opt in with dedupe_key have repeated keys collapsed
+    builder = DedupeBuilder()
+
+    serial(builder)
+    assert builder.get_called == 10
+    assert builder.process_called == 2
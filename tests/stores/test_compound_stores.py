@@ -92,6 +92,9 @@ def test_joint_store_query_one(jointstore):
     assert doc is None
     doc = jointstore.query_one(criteria={"test2.your_prop": {"$gt": 6}})
     assert doc["task_id"] == 8
+    # A caller supplied limit does not clash with the single-document limit
+    doc = jointstore.query_one(criteria={"test2.your_prop": {"$gt": 6}}, limit=5)
+    assert doc["task_id"] == 8
 
     # Test merge_at_root
     jointstore.merge_at_root = True
@@ -153,6 +156,12 @@ def test_joint_store_groupby(jointstore):
     assert len(one_docs[1]) == 2
     assert len(zero_docs[1]) == 3
 
+    # skip and limit page through the groups rather than the documents
+    docs = list(jointstore.groupby("category", skip=1, limit=1))
+    assert len(docs) == 1
+    assert docs[0][0]["category"] == 1
+    assert len(docs[0][1]) == 5
+
 
 def test_joint_update(jointstore):
     with pytest.raises(NotImplementedError):
@@ -190,6 +199,8 @@ def test_concat_store_distinct(concat_store):
 def test_concat_store_groupby(concat_store):
     assert len(list(concat_store.groupby("index"))) == 4
     assert len(list(concat_store.groupby("task_id"))) == 40
+    assert len(list(concat_store.groupby("index", skip=1, limit=2))) == 2
+    assert [g[0]["index"] for g in concat_store.groupby("index", skip=3)] == [30]
 
 
 def test_concat_store_count(concat_store):
@@ -203,6 +214,10 @@ def test_concat_store_query(concat_store):
     assert len(t_ids) == len(set(t_ids))
     assert len(t_ids) == 40
 
+    docs = list(concat_store.query(properties=["task_id"], skip=8, limit=5))
+    assert [d["task_id"] for d in docs] == t_ids[8:13]
+    assert len(list(concat_store.query(skip=35))) == 5
+
 
 def test_eq(mongostore, jointstore, concat_store):
     assert jointstore == jointstore
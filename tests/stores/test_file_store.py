@@ -233,6 +233,7 @@ def test_query(test_dir):
     """
     fs = FileStore(test_dir, read_only=True)
     fs.connect()
+    assert fs.cursor_options(10) == {}
     d = fs.query_one(
         {"name": "input.in", "parent": "calculation1"},
         properties=["file_id", "contents"],
@@ -375,10 +376,10 @@ def test_this_dir():
     assert not fs.name.endswith(".")
 
 
-def test_encoding():
+def test_encoding(tmp_path):
     """
     Make sure custom encoding works
     """
-    fs = FileStore(".", read_only=False, encoding="utf8")
+    fs = FileStore(tmp_path, read_only=False, encoding="utf8")
     fs.connect()
-    assert Path("FileStore.json").exists()
+    assert (tmp_path / "FileStore.json").exists()
@@ -152,6 +152,12 @@ def test_groupby(gridfsstore):
     assert by_group[1] == {"mp-0", "mp-1", "mp-2"}
     assert by_group[2] == {"mp-3", "mp-4", "mp-5", "mp-6"}
 
+    # skip and limit page through the groups rather than the documents
+    groups = list(gridfsstore.groupby("a", skip=1, limit=1))
+    assert len(groups) == 1
+    assert groups[0][0]["a"] == 2
+    assert {d["task_id"] for d in groups[0][1]} == {"mp-3", "mp-4", "mp-5", "mp-6"}
+
 
 def test_distinct(gridfsstore):
     tic = datetime(2018, 4, 12, 16)
@@ -1,6 +1,6 @@
 import os
 import shutil
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from unittest import mock
 
@@ -10,6 +10,7 @@ import pymongo.collection
 import pytest
 from bson.objectid import ObjectId
 from monty.tempfile import ScratchDir
+from pymongo import CursorType
 from pymongo.errors import ConfigurationError, DocumentTooLarge, OperationFailure
 
 from maggma.core import StoreError
@@ -168,6 +169,13 @@ def test_mongostore_groupby(mongostore):
     data = list(mongostore.groupby(["e", "d"]))
     assert len(data) == 3
 
+    # Paging sorts the groups by key
+    data = list(mongostore.groupby("e", skip=1))
+    assert [g[0]["e"] for g in data] == [8, 9]
+    data = list(mongostore.groupby("e", skip=1, limit=1))
+    assert [g[0]["e"] for g in data] == [8]
+    assert len(data[0][1]) == 1
+
 
 def test_mongostore_remove_docs(mongostore):
     mongostore._collection.insert_one({"a": 1, "b": 2, "c": 3})
@@ -233,15 +241,94 @@ def test_mongostore_newer_in(mongostore):
     assert len(target.newer_in(mongostore, exhaustive=True)) == 10
     assert len(mongostore.newer_in(target)) == 0
 
+    # keys missing from the target are also newer
+    mongostore.update([{mongostore.key: 10, mongostore.last_updated_field: datetime.utcnow()}])
+    assert set(target.newer_in(mongostore, exhaustive=True)) == set(range(11))
+    assert len(mongostore.newer_in(target, exhaustive=True)) == 0
+
     target._collection.drop()
 
 
+def test_mongostore_newer_in_pipeline():
+    source = MongoStore("maggma_test", "test")
+    target = MongoStore("maggma_test", "test_target", key="mp_id")
+
+    pipeline = source._newer_in_pipeline(target, criteria={"a": 1})
+    assert pipeline[0] == {"$match": {"a": 1}}
+    # the equality join on key fields can use an index on any MongoDB version
+    assert pipeline[2]["$lookup"] == {
+        "from": "test",
+        "localField": "mp_id",
+        "foreignField": "task_id",
+        "as": "_self",
+        "pipeline": [{"$project": {"_id": 0, "last_updated": 1}}],
+    }
+    assert pipeline[-1] == {"$group": {"_id": "$mp_id"}}
+
+    # servers before MongoDB 5.0 cannot project the joined documents
+    assert "pipeline" not in source._newer_in_pipeline(target, project_lookup=False)[2]["$lookup"]
+
+
+def test_mongostore_newer_in_lookup_projection(mongostore):
+    if mongostore._collection.database.client.server_info()["versionArray"] < [5]:
+        pytest.skip("Projecting a localField/foreignField $lookup needs MongoDB 5.0")
+
+    target = MongoStore("maggma_test", "test_target")
+    target.connect()
+
+    now = datetime.utcnow()
+    target.update([{"task_id": i, "last_updated": now, "data": "x" * 1000} for i in range(5)])
+    # the first two keys are older here than in the target and key 4 is missing
+    mongostore.update(
+        [
+            {"task_id": i, "last_updated": now + timedelta(seconds=-10 if i < 2 else 10), "data": "x" * 1000}
+            for i in range(4)
+        ]
+    )
+
+    pipeline = mongostore._newer_in_pipeline(target)
+    joined = list(target._collection.aggregate(pipeline[:3]))
+    assert all(list(doc) == ["last_updated"] for d in joined for doc in d["_self"])
+
+    assert set(mongostore.newer_in(target, exhaustive=True)) == {0, 1, 4}
+
+    target._collection.drop()
+
+
+def test_mongostore_newer_in_fallback():
+    source = MongoStore("maggma_test", "test")
+    source._coll = mock.MagicMock()
+    source._coll.database.client.server_info.return_value = {"versionArray": [7, 0, 0, 0]}
+    target = MongoStore("maggma_test", "test_target")
+    target._coll = mock.MagicMock()
+    target._coll.aggregate.side_effect = OperationFailure("$lookup is not supported on sharded collections")
+
+    generic_newer_in = mock.patch("maggma.core.store.Store.newer_in", return_value=[1, 2])
+    with mock.patch.object(source, "ensure_index"), generic_newer_in as generic:
+        assert source.newer_in(target, exhaustive=True) == [1, 2]
+    generic.assert_called_once_with(target, criteria=None, exhaustive=True)
+
+
+def test_mongostore_cursor_options():
+    store = MongoStore("maggma_test", "test")
+    store._coll = mock.MagicMock()
+
+    store._coll.database.client.is_mongos = False
+    assert store.cursor_options(50) == {"batch_size": 50, "cursor_type": CursorType.EXHAUST}
+
+    # exhaust cursors are not supported through mongos
+    store._coll.database.client.is_mongos = True
+    assert store.cursor_options(50) == {"batch_size": 50}
+
+
 # Memory store tests
 def test_memory_store_connect():
     memorystore = MemoryStore()
     assert memorystore._coll is None
     memorystore.connect()
     assert isinstance(memorystore._collection, mongomock.collection.Collection)
+    # mongomock reports itself as a mongos, so there is no exhaust cursor
+    assert memorystore.cursor_options(50) == {"batch_size": 50}
 
 
 def test_groupby(memorystore):
@@ -266,6 +353,11 @@ def test_groupby(memorystore):
     data = list(memorystore.groupby(["e", "d"]))
     assert len(data) == 3
 
+    data = list(memorystore.groupby(["e", "d"], skip=1, limit=1))
+    assert len(data) == 1
+    assert data[0][0] == {"e": 8, "d": 9}
+    assert len(list(memorystore.groupby(["e", "d"], skip=1))) == 2
+
     memorystore.update(
         [
             {"e": {"d": 9}, "f": 9},
@@ -336,6 +428,7 @@ def test_monty_store_query(montystore):
     assert montystore.query_one(properties=["a"])["a"] == 1
     assert montystore.query_one(properties=["b"])["b"] == 2
     assert montystore.query_one(properties=["c"])["c"] == 3
+    assert montystore.cursor_options(10) == {}
 
 
 def test_monty_store_count(montystore):
@@ -107,6 +107,14 @@ def test_multistore_query(multistore, mongostore, memorystore):
     assert temp_mongostore_facade.query_one(properties=["c"])["c"] == 6
 
 
+def test_multistore_query_one_limit(multistore, memorystore):
+    memorystore_facade = StoreFacade(memorystore, multistore)
+    memorystore_facade._collection.insert_many([{"a": i} for i in range(3)])
+
+    # query_one always limits to one document, even if the caller passes a limit
+    assert multistore.query_one(memorystore, criteria={"a": 1}, limit=5)["a"] == 1
+
+
 def test_multistore_count(multistore, mongostore, memorystore):
     memorystore_facade = StoreFacade(memorystore, multistore)
 
@@ -2,13 +2,15 @@
 Tests for builders
 """
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from time import sleep
 
 import pytest
+from dateutil import parser
 
 from maggma.utils import (
     Timeout,  # dt_to_isoformat_ceil_ms,; isostr_to_dt,
+    dedupe_by_key,
     dynamic_import,
     grouper,
     primed,
@@ -72,10 +74,38 @@ def test_datetime_utils():
 
     assert to_dt("2019-12-13T00:23:11.010") == datetime(2019, 12, 13, 0, 23, 11, 10000)
     assert to_dt(datetime(2019, 12, 13, 0, 23, 11, 10000)) == datetime(2019, 12, 13, 0, 23, 11, 10000)
+    assert to_dt("2019-12-13T00:23:11.010Z") == to_dt("2019-12-13T00:23:11.010+00:00")
+    assert to_dt("Dec 13 2019 00:23:11") == datetime(2019, 12, 13, 0, 23, 11)
+
+
+@pytest.mark.parametrize(
+    "dt_str",
+    [
+        # to_isoformat_ceil_ms of naive and aware datetimes
+        to_isoformat_ceil_ms(datetime(2019, 12, 13, 0, 23, 11, 10000)),
+        to_isoformat_ceil_ms(datetime(2019, 12, 13, 0, 23, 11, 10000, tzinfo=timezone.utc)),
+        to_isoformat_ceil_ms(datetime(2019, 12, 13, 0, 23, 11, tzinfo=timezone(timedelta(hours=-5)))),
+        # str() and isoformat() of datetimes, e.g. from jsanitize
+        str(datetime(2019, 12, 13, 0, 23, 11, 123456)),
+        str(datetime(2019, 12, 13, 0, 23, 11)),
+        datetime(2019, 12, 13, 0, 23, 11, 123456).isoformat(),
+        # Mongo extended JSON style and other strings only dateutil handles
+        "2019-12-13T00:23:11.010Z",
+        "2019-12-13T00:23:11.01",
+        "20191213T002311",
+        "Dec 13 2019 00:23:11",
+    ],
+)
+def test_to_dt_matches_dateutil(dt_str):
+    dt = to_dt(dt_str)
+    assert dt == parser.parse(dt_str)
+    assert (dt.tzinfo is None) == (parser.parse(dt_str).tzinfo is None)
+    assert dt.utcoffset() == parser.parse(dt_str).utcoffset()
 
 
 def test_dynamic_import():
     assert dynamic_import("maggma.stores", "MongoStore").__name__ == "MongoStore"
+    assert dynamic_import("maggma.stores.MongoStore") is dynamic_import("maggma.stores", "MongoStore")
 
 
 def test_grouper():
@@ -87,3 +117,14 @@ def test_grouper():
     my_groups = list(grouper(my_iterable, 10))
     assert len(my_groups) == 11
     assert len(my_groups[10]) == 1
+
+
+def test_dedupe_by_key():
+    items = [{"k": 1, "v": "a"}, {"k": 2, "v": "b"}, {"k": 1, "v": "c"}, {"v": "d"}, 5]
+
+    assert dedupe_by_key(items, "k") == [{"k": 1, "v": "c"}, {"k": 2, "v": "b"}, {"v": "d"}, 5]
+    assert dedupe_by_key(items, None) == items
+
+    # Unhashable key values can't be compared, so those documents are all kept
+    items = [{"k": [1], "v": "a"}, {"k": [1], "v": "b"}, {"k": {"a": 1}, "v": "c"}, {"k": 2, "v": "d"}]
+    assert dedupe_by_key(items, "k") == items